@@ -72,17 +72,17 @@ class AlertManager:
         for code, quote in quotes.items():
             rule = self._rules.get(code)
             if not rule:
-                self._logger.debug(f"[告警检查] {code} 无告警规则，跳过")
+                self._logger.debug("[告警检查] %s 无告警规则，跳过", code)
                 continue
 
             # 检查价格是否有效（避免价格为0或过小时触发告警）
             if quote.price is None or quote.price < 0.01:
-                self._logger.debug(f"[告警检查] {code} 价格无效或为0 ({quote.price})，跳过告警检查")
+                self._logger.debug("[告警检查] %s 价格无效或为0 (%s)，跳过告警检查", code, quote.price)
                 continue
 
             cp = quote.change_percent
             if cp is None:
-                self._logger.debug(f"[告警检查] {code} 涨跌幅为None，跳过")
+                self._logger.debug("[告警检查] %s 涨跌幅为None，跳过", code)
                 continue
 
             # Get threshold lists
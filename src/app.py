@@ -38,7 +38,10 @@ class ETFMonitorApp(wx.App):
         # Setup logging first
         config = get_config()
         log_level = config.get('log_level', 'INFO')
-        self.logger = setup_logger(log_level=getattr(__import__('logging'), log_level))
+        self.logger = setup_logger(
+            log_level=getattr(__import__('logging'), log_level),
+            rotate_daily=config.get('advanced.log_rotate_daily', False)
+        )
         
         self.logger.info("=" * 60)
         self.logger.info("ETF Monitor v1.2.0 Starting")
@@ -435,6 +438,7 @@ class ETFMonitorApp(wx.App):
             # Destroy tray icon
             if hasattr(self, 'tray_icon'):
                 self.logger.info("Destroying tray icon...")
+                self.tray_icon.cleanup()
                 self.tray_icon.Destroy()
             
             # Close API adapters
@@ -5,7 +5,7 @@ Implements singleton pattern for global configuration access with thread-safe op
 """
 
 import json
-import shutil
+import os
 from pathlib import Path
 from typing import Any, Dict, Optional
 from threading import Lock
@@ -88,7 +88,8 @@ class ConfigManager:
             "single_instance": True,
             "minimize_to_tray": True,
             "check_update": False,
-            "data_cache_expire": 300
+            "data_cache_expire": 300,
+            "log_rotate_daily": False
         }
     }
 
@@ -262,7 +263,9 @@ class ConfigManager:
         """
         Save configuration to file atomically.
         
-        Uses temporary file + rename for atomic operation to prevent data loss.
+        Uses temporary file + fsync + rename for atomic operation to prevent
+        data loss: a crash leaves either the old or the new file, never a
+        truncated one.
         
         Returns:
             True if saved successfully, False otherwise
@@ -272,12 +275,15 @@ class ConfigManager:
                 config_path = Path(self._config_file)
                 temp_path = config_path.with_suffix('.tmp')
                 
-                # Write to temporary file
-                with open(temp_path, 'w', encoding='utf-8') as f:
-                    json.dump(self._config, f, indent=2, ensure_ascii=False)
+                # Write to temporary file and make sure it hits the disk
+                data = json.dumps(self._config, indent=2, ensure_ascii=False).encode('utf-8')
+                with open(temp_path, 'wb') as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
                 
                 # Atomic rename (overwrites existing file)
-                shutil.move(str(temp_path), str(config_path))
+                os.replace(temp_path, config_path)
                 
                 self._logger.info(f"Configuration saved to {config_path}")
                 return True
@@ -5,6 +5,10 @@ Configuration validation with type checking and range validation.
 import re
 from typing import Any, Dict, List, Optional, Tuple
 
+# Compiled once at import instead of per validated entry
+_SYMBOL_RE = re.compile(r'\A[A-Za-z0-9]{1,10}(\.[A-Za-z]{2})?\Z')
+_ETF_CODE_RE = re.compile(r'\A\d{6}\Z', re.ASCII)
+
 
 class ConfigValidator:
     """
@@ -30,8 +34,7 @@ class ConfigValidator:
         if len(symbol) == 0:
             return False, "symbol cannot be empty"
         # 允许格式：AAPL、600519、600519.SH、TSLA.US 等
-        import re
-        if not re.match(r'^[A-Za-z0-9]{1,10}(\.[A-Za-z]{2})?$', symbol):
+        if not _SYMBOL_RE.match(symbol):
             return False, f"invalid symbol: {symbol}"
         return True, None
 
@@ -65,7 +68,7 @@ class ConfigValidator:
         if not isinstance(code, str):
             return False, "ETF code must be a string"
         
-        if not re.match(r'^\d{6}$', code):
+        if not _ETF_CODE_RE.match(code):
             return False, f"ETF code must be 6 digits, got: {code}"
         
         return True, None
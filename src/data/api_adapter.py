@@ -128,7 +128,7 @@ class EastMoneyAdapter(QuoteAPIAdapter):
             base_delay = 0.5
             for attempt in range(max_retries):
                 try:
-                    self.logger.debug(f"[EastMoney] 请求 {code} (attempt {attempt + 1}/{max_retries})")
+                    self.logger.debug("[EastMoney] 请求 %s (attempt %s/%s)", code, attempt + 1, max_retries)
                     response = self.client.get(url, params=params, headers=headers)
                     response.raise_for_status()
                     break  # Success, exit retry loop
@@ -281,7 +281,7 @@ class SinaAdapter(QuoteAPIAdapter):
             url = f"{self.base_url}{symbol}"
             
             # Send request with custom headers to avoid 403
-            self.logger.debug(f"[Sina] 请求 {code}")
+            self.logger.debug("[Sina] 请求 %s", code)
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
                 'Referer': 'https://finance.sina.com.cn/'
@@ -408,7 +408,7 @@ class TencentAdapter(QuoteAPIAdapter):
             url = f"{self.base_url}{symbol}"
             
             # Send request
-            self.logger.debug(f"[Tencent] 请求 {code}")
+            self.logger.debug("[Tencent] 请求 %s", code)
             response = self.client.get(url)
             response.raise_for_status()
             
@@ -552,7 +552,7 @@ class XueqiuAdapter(QuoteAPIAdapter):
             }
             
             # Send request
-            self.logger.debug(f"[Xueqiu] 请求 {code}")
+            self.logger.debug("[Xueqiu] 请求 %s", code)
             response = self.client.get(url, params=params)
             response.raise_for_status()
             
@@ -120,7 +120,7 @@ class CacheManager:
             # Get or create cache entry
             if code not in self._cache:
                 self._cache[code] = ETFCache()
-                self._logger.debug(f"Created cache entry for {code}")
+                self._logger.debug("Created cache entry for %s", code)
                 self._stats['cache_misses'] += 1
             else:
                 self._stats['cache_hits'] += 1
@@ -256,7 +256,7 @@ class CacheManager:
         with self._lock:
             if code in self._cache:
                 del self._cache[code]
-                self._logger.debug(f"Removed {code} from cache")
+                self._logger.debug("Removed %s from cache", code)
     
     def clear(self) -> None:
         """Clear all cache data."""
@@ -303,7 +303,7 @@ class CacheManager:
                 del self._request_cache[code]
 
             if expired_codes:
-                self._logger.debug(f"Cleaned up {len(expired_codes)} expired request cache entries")
+                self._logger.debug("Cleaned up %s expired request cache entries", len(expired_codes))
 
             return len(expired_codes)
 
@@ -7,7 +7,7 @@ Runs in background thread to fetch ETF quotes periodically without blocking UI.
 import time
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Optional, Callable
+from typing import Iterable, List, Optional, Callable, Tuple
 from queue import Queue
 
 from .models import ETFQuote
@@ -72,6 +72,8 @@ class DataFetcher:
         self._thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
         self._pause_event = threading.Event()
+        # Guards the code list and executor against updates from other threads
+        self._codes_lock = threading.Lock()
         
         # Failover tracking
         self._consecutive_failures = 0
@@ -143,13 +145,62 @@ class DataFetcher:
         """
         Update ETF codes list.
         
+        Compatibility wrapper around the delta path: the delta against the
+        current list is computed and applied under one hold of the codes
+        lock, so a concurrent apply_etf_delta cannot make it stale.
+        
         Args:
             etf_codes: New list of ETF codes
         """
-        self._etf_codes = etf_codes.copy()
-        self._max_workers = min(len(etf_codes), 10) if etf_codes else 1
+        with self._codes_lock:
+            current = set(self._etf_codes)
+            wanted = set(etf_codes)
+            result = self._apply_delta_locked(
+                added=[code for code in etf_codes if code not in current],
+                removed=current - wanted
+            )
+        self._log_delta(result)
+    
+    def apply_etf_delta(self, added: Iterable[str] = (), removed: Iterable[str] = ()) -> None:
+        """
+        Add and remove ETF codes without replacing the whole list.
+        
+        Existing codes keep their order; new codes are appended.
+        
+        Args:
+            added: Codes to start monitoring
+            removed: Codes to stop monitoring
+        """
+        with self._codes_lock:
+            result = self._apply_delta_locked(added, removed)
+        self._log_delta(result)
+    
+    def _apply_delta_locked(
+        self, added: Iterable[str], removed: Iterable[str]
+    ) -> Optional[Tuple[int, int, int]]:
+        """
+        Apply a code delta; caller must hold _codes_lock.
+        
+        Returns:
+            (added count, removed count, total codes), or None if nothing changed
+        """
+        removed = set(removed)
+        present = set(self._etf_codes)
+        added = [code for code in dict.fromkeys(added) if code not in present]
+        removed &= present
+        if not added and not removed:
+            return None
+        
+        if removed:
+            self._etf_codes = [code for code in self._etf_codes if code not in removed]
+        self._etf_codes.extend(added)
+        self._max_workers = min(len(self._etf_codes), 10) if self._etf_codes else 1
         self._ensure_executor()
-        self._logger.info(f"Updated ETF list: {len(etf_codes)} codes")
+        return len(added), len(removed), len(self._etf_codes)
+    
+    def _log_delta(self, result: Optional[Tuple[int, int, int]]) -> None:
+        if result is not None:
+            self._logger.info("Updated ETF list: +%s -%s, %s codes", *result)
     
     def update_refresh_interval(self, interval: int) -> None:
         """
@@ -196,7 +247,7 @@ class DataFetcher:
                 duration = time.time() - start_time
                 self._last_fetch_time = start_time
                 self._last_fetch_duration = duration
-                self._logger.debug(f"Fetch completed in {duration:.2f}s ({len(self._etf_codes)} ETFs)")
+                self._logger.debug("Fetch completed in %.2fs (%s ETFs)", duration, len(self._etf_codes))
                 
                 # Wait for next interval or stop event
                 if self._stop_event.wait(timeout=self._refresh_interval):
@@ -209,15 +260,16 @@ class DataFetcher:
     
     def _fetch_all_quotes(self) -> None:
         """Fetch quotes for all ETF codes concurrently."""
-        if not self._etf_codes:
-            return
-        
-        # Ensure executor exists and submit tasks
-        self._ensure_executor()
-        future_to_code = {
-            self._executor.submit(self._fetch_single_quote, code): code
-            for code in self._etf_codes
-        }
+        with self._codes_lock:
+            if not self._etf_codes:
+                return
+            
+            # Ensure executor exists and submit tasks
+            self._ensure_executor()
+            future_to_code = {
+                self._executor.submit(self._fetch_single_quote, code): code
+                for code in self._etf_codes
+            }
         
         quotes = {}
         changed_codes = []
@@ -288,7 +340,7 @@ class DataFetcher:
         if not self._cache_manager.should_fetch(code):
             cached_quote = self._cache_manager.get_request_cached(code)
             if cached_quote:
-                self._logger.debug(f"[Request Cache] Using cached data for {code}")
+                self._logger.debug("[Request Cache] Using cached data for %s", code)
                 return cached_quote
 
         # Fetch with exponential backoff retry
@@ -327,10 +379,10 @@ class DataFetcher:
                 if '403' in str(e):
                     if not hasattr(self, '_last_403_log') or \
                        time.time() - self._last_403_log > 60:  # 1分钟记录一次
-                        self._logger.debug(f"Attempt {attempt + 1} failed for {code}: {e}")
+                        self._logger.debug("Attempt %s failed for %s: %s", attempt + 1, code, e)
                         self._last_403_log = time.time()
                 else:
-                    self._logger.debug(f"Attempt {attempt + 1} failed for {code}: {e}")
+                    self._logger.debug("Attempt %s failed for %s: %s", attempt + 1, code, e)
                     
                 if attempt < self._retry_count:
                     time.sleep(self._retry_interval)
@@ -4,8 +4,8 @@ Data models for ETF quotes and cache structures.
 Uses dataclasses for type-safe, immutable data structures with clear field definitions.
 """
 
-from dataclasses import dataclass, field
-from typing import Optional
+from dataclasses import dataclass, field, asdict
+from typing import Optional, List
 from datetime import datetime
 
 
@@ -25,6 +25,12 @@ class ETFQuote:
         update_time: Update time string (HH:MM:SS)
         timestamp: Unix timestamp of data
     """
+    # One instance per code per fetch round: slots drop the per-instance __dict__
+    __slots__ = (
+        'code', 'name', 'price', 'change', 'change_percent',
+        'volume', 'pre_close', 'update_time', 'timestamp',
+    )
+    
     code: str
     name: str
     price: float
@@ -35,6 +41,14 @@ class ETFQuote:
     update_time: str
     timestamp: float
     
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state):
+        # frozen blocks normal setattr; copy/pickle restore through here
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+    
     def __post_init__(self):
         if not self.code:
             raise ValueError("Invalid code")
@@ -130,3 +144,39 @@ class ETFCache:
         """Check if cache contains valid data."""
         return self.data is not None
 
+
+@dataclass
+class Symbol:
+    """
+    Monitored symbol with its alert settings, parsed once from config.
+    
+    Declares __slots__ by hand (dataclass(slots=True) needs Python 3.10),
+    so instances carry no per-object __dict__ and attribute reads skip
+    the dict lookups of the raw config entries.
+    
+    Attributes:
+        symbol: Stock/ETF code (e.g., "512170")
+        name: Display name
+        up_thresholds: Rise alert thresholds in percent
+        down_thresholds: Fall alert thresholds in percent
+        duration_secs: Alert popup duration in seconds
+    """
+    __slots__ = ('symbol', 'name', 'up_thresholds', 'down_thresholds', 'duration_secs')
+    
+    symbol: str
+    name: str
+    up_thresholds: List[float]
+    down_thresholds: List[float]
+    duration_secs: int
+    
+    # Popup duration for symbols added without explicit alert settings
+    DEFAULT_DURATION_SECS = 5
+    
+    @classmethod
+    def new(cls, symbol: str, name: str) -> "Symbol":
+        """Create a symbol with no alert thresholds and the default duration."""
+        return cls(symbol, name, [], [], cls.DEFAULT_DURATION_SECS)
+    
+    def to_dict(self) -> dict:
+        """Convert to the plain dict stored under 'symbols' in config."""
+        return asdict(self)
@@ -113,10 +113,16 @@ class Typography:
     WEIGHT_MEDIUM = wx.FONTWEIGHT_NORMAL  # wxPython doesn't have medium
     WEIGHT_BOLD = wx.FONTWEIGHT_BOLD
     
+    # (size, weight, family) -> wx.Font, filled lazily since fonts need a wx.App
+    _font_cache = {}
+    
     @staticmethod
     def get_font(size: int, weight=wx.FONTWEIGHT_NORMAL, family=wx.FONTFAMILY_DEFAULT) -> wx.Font:
         """
-        Create a font with specified parameters.
+        Get a font with specified parameters.
+        
+        Fonts are created once per parameter set and shared afterwards,
+        so callers must not modify the returned font in place.
         
         Args:
             size: Font size in points
@@ -126,7 +132,12 @@ class Typography:
         Returns:
             wx.Font object
         """
-        return wx.Font(size, family, wx.FONTSTYLE_NORMAL, weight)
+        key = (size, weight, family)
+        font = Typography._font_cache.get(key)
+        if font is None:
+            font = wx.Font(size, family, wx.FONTSTYLE_NORMAL, weight)
+            Typography._font_cache[key] = font
+        return font
     
     @staticmethod
     def h1() -> wx.Font:
@@ -428,7 +428,7 @@ class FloatingWindow(wx.Frame):
         else:
             # 否则轮播所有ETF
             self._changed_etf_codes = list(etf_data.keys())
-            self._logger.debug(f"[智能轮播] 未提供变化列表，轮播所有 {len(self._changed_etf_codes)} 个ETF")
+            self._logger.debug("[智能轮播] 未提供变化列表，轮播所有 %s 个ETF", len(self._changed_etf_codes))
         
         # 如果当前轮播列表为空，回退到全部
         if not self._changed_etf_codes:
@@ -463,14 +463,14 @@ class FloatingWindow(wx.Frame):
         
         # 闭市时停止轮播
         if not is_trading_time():
-            self._logger.debug(f"[轮播控制] 闭市时段，停止轮播")
+            self._logger.debug("[轮播控制] 闭市时段，停止轮播")
             return
         
         if self._changed_etf_codes:
             old_index = self._current_index
             self._current_index = (self._current_index + 1) % len(self._changed_etf_codes)
             code = self._changed_etf_codes[self._current_index]
-            self._logger.debug(f"[轮播控制] 索引 {old_index} → {self._current_index}，显示 {code}")
+            self._logger.debug("[轮播控制] 索引 %s → %s，显示 %s", old_index, self._current_index, code)
             self._update_display()
     
     def _on_timeout_check(self, event):
@@ -522,16 +522,16 @@ class FloatingWindow(wx.Frame):
     def _update_display(self):
         """更新显示内容。"""
         # 在开头添加闭市检测
-        from ..utils.helpers import is_trading_time, get_next_trading_time
+        from ..utils.helpers import get_trading_status
         
-        if not is_trading_time():
-            trading_status = get_next_trading_time()
+        trading, trading_status = get_trading_status()
+        if not trading:
             self._line_label.SetLabel("已收盘")
             self._panel.SetBackgroundColour(wx.Colour(200, 200, 200))
             self._line_label.SetForegroundColour(wx.Colour(80, 80, 80))
             self._panel.Refresh()
             self._relayout_components()
-            self._logger.debug(f"[显示更新] 闭市状态: {trading_status}")
+            self._logger.debug("[显示更新] 闭市状态: %s", trading_status)
             return
         
         if not self._changed_etf_codes or not self._etf_data:
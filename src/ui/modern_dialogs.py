@@ -92,7 +92,7 @@ class ModernEditDialog(wx.Dialog):
         
         # Up threshold field (now supports multiple values)
         up_thresholds = self.stock_data.get('up_thresholds', [])
-        up_str = ', '.join([str(t) for t in up_thresholds]) if up_thresholds else ''
+        up_str = ', '.join(map(str, up_thresholds)) if up_thresholds else ''
         up_sizer, self.up_ctrl, self.up_error = self._create_field(
             parent,
             "上涨阈值 (%)",
@@ -103,7 +103,7 @@ class ModernEditDialog(wx.Dialog):
         
         # Down threshold field (now supports multiple values)
         down_thresholds = self.stock_data.get('down_thresholds', [])
-        down_str = ', '.join([str(t) for t in down_thresholds]) if down_thresholds else ''
+        down_str = ', '.join(map(str, down_thresholds)) if down_thresholds else ''
         down_sizer, self.down_ctrl, self.down_error = self._create_field(
             parent,
             "下跌阈值 (%)",
@@ -1,13 +1,19 @@
 import wx
 import wx.grid as gridlib
+import atexit
 import threading
-from typing import List, Dict
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
+from operator import itemgetter
+from typing import List, Dict, Optional, Tuple
 
 from ..utils.logger import get_logger
 from ..config.manager import get_config
 from ..alerts.manager import AlertManager
 from ..data.cache import CacheManager
-from ..utils.helpers import Debouncer
+from ..data.models import Symbol
+from ..utils.helpers import Debouncer, format_price
 from .alert_popup import show_toast
 from .design_system import (
     Colors, Typography, Spacing, ComponentStyles,
@@ -15,6 +21,188 @@ from .design_system import (
 )
 from .modern_dialogs import ModernEditDialog, ModernAddDialog
 
+# Grid column layout
+COL_CODE, COL_NAME, COL_PRICE, COL_UP, COL_DOWN, COL_DURATION, COL_EDIT, COL_DELETE = range(8)
+COL_LABELS = (
+    "代码", "名称", "当前价格", "上涨阈值 (%)",
+    "下跌阈值 (%)", "弹窗时长 (秒)", "编辑", "删除",
+)
+
+# Display name used when a code's name cannot be looked up
+FALLBACK_NAME_FORMAT = "ETF{code}"
+
+# Single worker so fetcher list updates apply in submission order, off the UI thread
+_FETCHER_UPDATE_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="etf-fetcher-update")
+
+# Single worker so config file writes never overlap and land in order
+_CONFIG_SAVE_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="etf-config-save")
+
+
+class SymbolTable(gridlib.GridTableBase):
+    """
+    Virtual grid table backed by the manager's sorted symbol rows.
+
+    The grid only asks for the cells it is about to paint, so a refresh
+    costs O(visible cells) instead of pushing every string into wx's
+    default table. Styling comes from one cached attribute per column.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._rows: List[Symbol] = []
+        self._row_by_code: Dict[str, int] = {}
+        self._price_by_code: Dict[str, str] = {}
+        self._color_by_code: Dict[str, wx.Colour] = {}
+        # Last rendered signature per row, used to diff successive refreshes
+        self._rendered: List[Tuple] = []
+        self._col_attrs = self._build_col_attrs()
+        self._price_attrs: Dict[int, gridlib.GridCellAttr] = {}
+
+    @staticmethod
+    def _build_col_attrs() -> Dict[int, gridlib.GridCellAttr]:
+        """Build the static per-column styling once."""
+        attrs = {}
+        for col in range(len(COL_LABELS)):
+            attr = gridlib.GridCellAttr()
+            if col in (COL_CODE, COL_NAME, COL_PRICE, COL_EDIT, COL_DELETE):
+                attr.SetReadOnly(True)
+            attrs[col] = attr
+
+        # One font object shared by every column that uses the body style
+        body_font = Typography.body()
+        attrs[COL_CODE].SetFont(body_font)
+        attrs[COL_CODE].SetTextColour(Colors.TEXT_PRIMARY)
+        attrs[COL_NAME].SetTextColour(Colors.TEXT_PRIMARY)
+        attrs[COL_PRICE].SetBackgroundColour(Colors.INFO_LIGHT)
+        attrs[COL_PRICE].SetTextColour(Colors.TEXT_PRIMARY)
+        attrs[COL_PRICE].SetFont(body_font)
+        attrs[COL_UP].SetTextColour(Colors.SUCCESS_DARK)
+        attrs[COL_DOWN].SetTextColour(Colors.ERROR_DARK)
+        attrs[COL_DURATION].SetTextColour(Colors.TEXT_SECONDARY)
+        attrs[COL_EDIT].SetBackgroundColour(Colors.PRIMARY_100)
+        attrs[COL_EDIT].SetTextColour(Colors.PRIMARY_700)
+        attrs[COL_EDIT].SetAlignment(wx.ALIGN_CENTER, wx.ALIGN_CENTER)
+        attrs[COL_DELETE].SetBackgroundColour(Colors.ERROR_LIGHT)
+        attrs[COL_DELETE].SetTextColour(Colors.ERROR_DARK)
+        attrs[COL_DELETE].SetAlignment(wx.ALIGN_CENTER, wx.ALIGN_CENTER)
+        return attrs
+
+    def set_data(self, rows: List[Symbol], price_by_code: Dict[str, str],
+                 color_by_code: Dict[str, wx.Colour]) -> Optional[List[int]]:
+        """
+        Swap in the rows and price strings the grid should display.
+
+        Returns the indices of rows whose displayed content changed, or
+        None when rows were added, removed or reordered.
+        """
+        rendered = [self._row_signature(s, price_by_code, color_by_code) for s in rows]
+        old = self._rendered
+
+        self._rows = rows
+        self._row_by_code = {s.symbol: i for i, s in enumerate(rows)}
+        self._price_by_code = price_by_code
+        self._color_by_code = color_by_code
+        self._rendered = rendered
+
+        if len(old) != len(rendered):
+            return None
+        changed = []
+        for i, (before, after) in enumerate(zip(old, rendered)):
+            if before[0] != after[0]:
+                return None
+            if before != after:
+                changed.append(i)
+        return changed
+
+    @staticmethod
+    def _row_signature(s: Symbol, price_by_code: Dict[str, str],
+                       color_by_code: Dict[str, wx.Colour]) -> Tuple:
+        """Snapshot everything a row displays; thresholds are copied since edits mutate them."""
+        code = s.symbol
+        color = color_by_code.get(code)
+        return (
+            code,
+            s.name,
+            price_by_code.get(code, ''),
+            tuple(s.up_thresholds),
+            tuple(s.down_thresholds),
+            s.duration_secs,
+            color.GetRGB() if color is not None else None,
+        )
+
+    def remove_row(self, code: str) -> Optional[int]:
+        """Drop the row for a code; returns its former index, or None if absent."""
+        row = self._row_by_code.pop(code, None)
+        if row is None:
+            return None
+        del self._rows[row]
+        del self._rendered[row]
+        for other, index in self._row_by_code.items():
+            if index > row:
+                self._row_by_code[other] = index - 1
+        return row
+
+    def GetNumberRows(self):
+        return len(self._rows)
+
+    def GetNumberCols(self):
+        return len(COL_LABELS)
+
+    def GetColLabelValue(self, col):
+        return COL_LABELS[col]
+
+    def IsEmptyCell(self, row, col):
+        return not self.GetValue(row, col)
+
+    def GetValue(self, row, col):
+        if row >= len(self._rows):
+            return ''
+        s = self._rows[row]
+        if col == COL_CODE:
+            return s.symbol
+        if col == COL_NAME:
+            return s.name
+        if col == COL_PRICE:
+            return self._price_by_code.get(s.symbol, '')
+        if col == COL_UP:
+            up_thresholds = s.up_thresholds
+            return ', '.join(map(str, up_thresholds)) if up_thresholds else ''
+        if col == COL_DOWN:
+            down_thresholds = s.down_thresholds
+            return ', '.join(map(str, down_thresholds)) if down_thresholds else ''
+        if col == COL_DURATION:
+            return str(s.duration_secs)
+        if col == COL_EDIT:
+            return "✏️ 编辑"
+        if col == COL_DELETE:
+            return "🗑️ 删除"
+        return ''
+
+    def SetValue(self, row, col, value):
+        # Read-only table; edits go through the dialogs
+        pass
+
+    def GetAttr(self, row, col, kind):
+        attr = self._col_attrs[col]
+        if col == COL_PRICE and row < len(self._rows):
+            color = self._color_by_code.get(self._rows[row].symbol)
+            if color is not None:
+                attr = self._price_attr(color)
+        # The grid releases one reference per returned attribute
+        attr.IncRef()
+        return attr
+
+    def _price_attr(self, color: wx.Colour) -> gridlib.GridCellAttr:
+        """Return the cached price-column attribute for a text colour."""
+        key = color.GetRGB()
+        attr = self._price_attrs.get(key)
+        if attr is None:
+            attr = self._col_attrs[COL_PRICE].Clone()
+            attr.SetTextColour(color)
+            self._price_attrs[key] = attr
+        return attr
+
+
 class StockManagerFrame(wx.Frame):
     """
     Modern Stock Manager UI with Material Design principles.
@@ -43,15 +231,56 @@ class StockManagerFrame(wx.Frame):
 
         self._app = app
         self._config = get_config()
+        self.refresh_bindings()
 
         # Load symbols (with migration from etf_list if needed)
-        self._symbols = self._load_symbols()
-        self._logger.info(f"[股票管理窗口] 加载了 {len(self._symbols)} 只股票")
+        # Insertion-ordered store keyed by code: O(1) lookup, add and delete
+        self._symbols_by_code: Dict[str, Symbol] = {
+            s.symbol: s for s in self._load_symbols()
+        }
+        self._logger.info(f"[股票管理窗口] 加载了 {len(self._symbols_by_code)} 只股票")
 
         self._sort_key = 'symbol'
         self._sort_asc = True
+        # Sorted rows for the current key/direction; None when symbols or sort changed
+        self._sorted_cache: Optional[List[Symbol]] = None
         self._debouncer = Debouncer()
 
+        # Set when a refresh was skipped because the window was not visible
+        self._dirty = False
+        # Set while a coalesced refresh is scheduled
+        self._refresh_pending = False
+        # Last stats label text and the sampled cache hit rate behind it
+        self._last_stats_label: Optional[str] = None
+        self._hit_rate: Optional[float] = None
+        self._hit_rate_ts = 0.0
+        # Codes whose missing quote is being fetched in the background
+        self._inflight_fetches = set()
+        # code -> (quote, price text, color) as of the last refresh
+        self._rendered_quotes: Dict[str, Tuple[object, str, Optional[wx.Colour]]] = {}
+
+        # Debounced persistence: edits mark the symbols dirty, one write per burst
+        self._symbols_dirty = False
+        # One persistent one-shot timer; restarting it pushes the write back
+        self._save_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self._on_save_timer, self._save_timer)
+        atexit.register(self._flush_symbols)
+
+        # Shared worker pool for background API calls (bounded, reused across clicks)
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="stockmgr")
+
+        # Row actions currently running, keyed "action:code"; blocks duplicate clicks
+        # until the first one finishes instead of dropping clicks for a fixed window
+        self._inflight_actions = set()
+        self._inflight_lock = threading.Lock()
+
+        # Set when a context menu item hands the guard over to a dialog
+        self._menu_item_clicked = False
+
+        # Toasts queued within a short window are merged into one banner
+        self._pending_toasts: Dict[str, List[str]] = defaultdict(list)
+        self._toast_timer = None
+
         # Pause floating window guard to prevent focus stealing
         self._pause_floating_window_guard()
 
@@ -64,16 +293,29 @@ class StockManagerFrame(wx.Frame):
         # Bind events
         self._bind()
 
-        # Initial grid refresh
-        self._logger.info("[股票管理窗口] 开始初始刷新表格")
-        self._refresh_grid()
+        # The frame is not shown yet; the first EVT_SHOW fills the grid
+        self._dirty = True
 
         # Bind close event to resume floating window guard
         self.Bind(wx.EVT_CLOSE, self._on_close)
 
+        # Catch up on refreshes skipped while hidden or minimized
+        self.Bind(wx.EVT_SHOW, self._on_show)
+        self.Bind(wx.EVT_ICONIZE, self._on_iconize)
+
         self._logger.info("[股票管理窗口] 初始化完成")
         self._logger.info("=" * 60)
 
+    def refresh_bindings(self):
+        """Re-read the app's cache manager and quote adapter; call if the app replaces them."""
+        self._cache = getattr(self._app, 'cache_manager', None)
+        self._adapter = getattr(self._app, 'primary_adapter', None)
+
+    @property
+    def _symbols(self) -> List[Symbol]:
+        """Symbols in insertion order (list view over the code-keyed store)."""
+        return list(self._symbols_by_code.values())
+
     def _create_ui(self):
         """Create simplified UI layout with grid only."""
         # Main panel with modern background
@@ -93,6 +335,10 @@ class StockManagerFrame(wx.Frame):
 
         self._panel.SetSizer(main_sizer)
 
+        # Context menu is built once and reused for every right-click
+        self._context_menu = wx.Menu()
+        self._add_menu_item = self._context_menu.Append(wx.ID_ANY, "添加股票")
+
     def _create_simple_toolbar(self) -> wx.BoxSizer:
         """Create simple toolbar with help text and stats."""
         toolbar_sizer = wx.BoxSizer(wx.HORIZONTAL)
@@ -165,30 +411,21 @@ class StockManagerFrame(wx.Frame):
     def _create_grid(self):
         """Create modern styled grid."""
         self._grid = gridlib.Grid(self._panel)
-        self._grid.CreateGrid(0, 8)
-
-        # Set column labels
-        self._grid.SetColLabelValue(0, "代码")
-        self._grid.SetColLabelValue(1, "名称")
-        self._grid.SetColLabelValue(2, "当前价格")
-        self._grid.SetColLabelValue(3, "上涨阈值 (%)")
-        self._grid.SetColLabelValue(4, "下跌阈值 (%)")
-        self._grid.SetColLabelValue(5, "弹窗时长 (秒)")
-        self._grid.SetColLabelValue(6, "编辑")
-        self._grid.SetColLabelValue(7, "删除")
+        self._table = SymbolTable()
+        self._grid.SetTable(self._table, True, gridlib.Grid.GridSelectRows)
 
         # Disable editing (use buttons instead)
         self._grid.EnableEditing(False)
 
         # Set column sizes
-        self._grid.SetColSize(0, 100)  # Code
-        self._grid.SetColSize(1, 150)  # Name
-        self._grid.SetColSize(2, 120)  # Price
-        self._grid.SetColSize(3, 120)  # Up threshold
-        self._grid.SetColSize(4, 120)  # Down threshold
-        self._grid.SetColSize(5, 120)  # Duration
-        self._grid.SetColSize(6, 80)   # Edit button
-        self._grid.SetColSize(7, 80)   # Delete button
+        self._grid.SetColSize(COL_CODE, 100)
+        self._grid.SetColSize(COL_NAME, 150)
+        self._grid.SetColSize(COL_PRICE, 120)
+        self._grid.SetColSize(COL_UP, 120)
+        self._grid.SetColSize(COL_DOWN, 120)
+        self._grid.SetColSize(COL_DURATION, 120)
+        self._grid.SetColSize(COL_EDIT, 80)    # Edit button
+        self._grid.SetColSize(COL_DELETE, 80)  # Delete button
 
     def _create_footer(self) -> wx.BoxSizer:
         """Create footer with additional info."""
@@ -228,19 +465,6 @@ class StockManagerFrame(wx.Frame):
         self._grid.SetSelectionBackground(Colors.PRIMARY_50)
         self._grid.SetSelectionForeground(Colors.TEXT_PRIMARY)
 
-        # Bind events
-        self._bind()
-
-        # Initial grid refresh
-        self._logger.info("[股票管理窗口] 开始初始刷新表格")
-        self._refresh_grid()
-
-        # Bind close event to resume floating window guard
-        self.Bind(wx.EVT_CLOSE, self._on_close)
-
-        self._logger.info("[股票管理窗口] 初始化完成")
-        self._logger.info("=" * 60)
-
     def _bind(self):
         """Bind all event handlers."""
         self._logger.info("[事件绑定] 开始绑定事件处理器")
@@ -248,23 +472,27 @@ class StockManagerFrame(wx.Frame):
         # Grid events
         self._grid.Bind(gridlib.EVT_GRID_CELL_LEFT_CLICK, self._on_cell_click)
         self._grid.Bind(gridlib.EVT_GRID_LABEL_LEFT_CLICK, self._on_label_click)
-        self._grid.Bind(gridlib.EVT_GRID_CELL_RIGHT_CLICK, self._on_grid_right_click)
+        # Context menu item handler is bound once
+        self.Bind(wx.EVT_MENU, self._on_add_from_menu, self._add_menu_item)
+
+        # One throttled handler for every right-click source
+        self._grid.Bind(gridlib.EVT_GRID_CELL_RIGHT_CLICK, self._on_any_context_menu)
 
-        # Context menu for empty areas
+        # 1. Empty grid area
         grid_window = self._grid.GetGridWindow()
         if grid_window:
-            grid_window.Bind(wx.EVT_CONTEXT_MENU, self._on_grid_context_menu)
+            grid_window.Bind(wx.EVT_CONTEXT_MENU, self._on_any_context_menu)
             self._logger.info("[事件绑定] 已绑定网格窗口上下文菜单事件")
         else:
             self._logger.warning("[事件绑定] 无法获取网格窗口")
 
         # 2. Panel for areas outside the grid
-        self._panel.Bind(wx.EVT_CONTEXT_MENU, self._on_panel_context_menu)
+        self._panel.Bind(wx.EVT_CONTEXT_MENU, self._on_any_context_menu)
         print("[DEBUG] 已绑定面板上下文菜单事件")
         self._logger.info("[事件绑定] 已绑定面板上下文菜单事件")
 
         # 3. Frame itself as a fallback
-        self.Bind(wx.EVT_CONTEXT_MENU, self._on_frame_context_menu)
+        self.Bind(wx.EVT_CONTEXT_MENU, self._on_any_context_menu)
         print("[DEBUG] 已绑定窗口上下文菜单事件")
         self._logger.info("[事件绑定] 已绑定窗口上下文菜单事件")
 
@@ -272,7 +500,7 @@ class StockManagerFrame(wx.Frame):
         print("=" * 80)
         self._logger.info("[事件绑定] 所有事件绑定完成")
 
-    def _load_symbols(self) -> List[Dict]:
+    def _load_symbols(self) -> List[Symbol]:
         """Load symbols from config with validation and migration from etf_list."""
         self._logger.info("[配置加载] 开始加载股票列表")
         data = self._config.get('symbols', []) or []
@@ -282,18 +510,11 @@ class StockManagerFrame(wx.Frame):
             etf_list = self._config.get('etf_list', []) or []
             if etf_list:
                 self._logger.info(f"[配置加载] 检测到 etf_list 有 {len(etf_list)} 个代码，开始迁移到 symbols")
-                # Fetch names for each code
-                for code in etf_list:
-                    if isinstance(code, str) and code.strip():
-                        name = self._fetch_stock_name(code.strip())
-                        data.append({
-                            'symbol': code.strip(),
-                            'name': name,
-                            'up_thresholds': [],
-                            'down_thresholds': [],
-                            'duration_secs': 5
-                        })
-                        self._logger.info(f"[配置加载] 迁移股票: {code} -> {name}")
+                codes = [c.strip() for c in etf_list if isinstance(c, str) and c.strip()]
+                # Fetch names concurrently so startup waits ~one round-trip, not one per code
+                for code, name in zip(codes, self._fetch_stock_names(codes)):
+                    data.append(Symbol.new(code, name).to_dict())
+                    self._logger.info(f"[配置加载] 迁移股票: {code} -> {name}")
 
                 # Save migrated data
                 if data:
@@ -328,57 +549,91 @@ class StockManagerFrame(wx.Frame):
             elif not isinstance(down_th, list):
                 down_th = []
             
-            normalized = {
-                'symbol': s.get('symbol'),
-                'name': s.get('name', ''),
-                'up_thresholds': up_th,
-                'down_thresholds': down_th,
-                'duration_secs': int(s.get('duration_secs', 5))
-            }
+            normalized = Symbol(
+                symbol=s.get('symbol'),
+                name=s.get('name', ''),
+                up_thresholds=up_th,
+                down_thresholds=down_th,
+                duration_secs=int(s.get('duration_secs', Symbol.DEFAULT_DURATION_SECS))
+            )
             validated_symbols.append(normalized)
-            self._logger.debug(f"[配置加载] 加载股票: {normalized}")
+            self._logger.debug("[配置加载] 加载股票: %s", normalized)
 
         self._logger.info(f"[配置加载] 成功加载 {len(validated_symbols)} 只股票")
         return validated_symbols
 
+    def _fetch_stock_names(self, codes: List[str], timeout: float = 5.0) -> List[str]:
+        """Fetch names for many codes in parallel; slow or failed lookups fall back to the code."""
+        if not codes:
+            return []
+        executor = ThreadPoolExecutor(max_workers=min(8, len(codes)), thread_name_prefix="stockmgr-names")
+        try:
+            futures = [executor.submit(self._fetch_stock_name, code) for code in codes]
+            # One shared deadline for the whole batch, not timeout per lookup
+            done, _ = wait(futures, timeout=timeout)
+            names = []
+            for code, future in zip(codes, futures):
+                if future in done and future.exception() is None:
+                    names.append(future.result())
+                else:
+                    self._logger.warning(
+                        "[获取名称] 获取超时或失败 %s: %s",
+                        code, future.exception() if future in done else "timeout"
+                    )
+                    names.append(FALLBACK_NAME_FORMAT.format(code=code))
+            return names
+        finally:
+            # Don't block startup on lookups that are still running
+            executor.shutdown(wait=False)
+
     def _fetch_stock_name(self, code: str) -> str:
         """Fetch stock name from API or cache."""
         try:
             # Try cache first
-            cache = getattr(self._app, 'cache_manager', None)
+            cache = self._cache
             if cache:
                 cached_quote = cache.get(code)
                 if cached_quote and cached_quote.name:
-                    self._logger.debug(f"[获取名称] 从缓存获取: {code} -> {cached_quote.name}")
+                    self._logger.debug("[获取名称] 从缓存获取: %s -> %s", code, cached_quote.name)
                     return cached_quote.name
 
             # Fetch from API
-            adapter = getattr(self._app, 'primary_adapter', None)
+            adapter = self._adapter
             if adapter:
-                self._logger.debug(f"[获取名称] 从API获取: {code}")
+                self._logger.debug("[获取名称] 从API获取: %s", code)
                 quote = adapter.fetch_quote(code)
                 if quote and quote.name:
-                    self._logger.debug(f"[获取名称] API返回: {code} -> {quote.name}")
+                    self._logger.debug("[获取名称] API返回: %s -> %s", code, quote.name)
+                    # Populate the cache so later lookups and the grid skip the API
+                    if cache is not None:
+                        cache.update(quote)
                     return quote.name
         except Exception as e:
             self._logger.warning(f"[获取名称] 获取失败 {code}: {e}")
 
         # Fallback to code
-        return f"股票{code}"
+        return FALLBACK_NAME_FORMAT.format(code=code)
+
+    def _save_symbols(self, background: bool = False):
+        """
+        Save symbols to config with validation.
 
-    def _save_symbols(self):
-        """Save symbols to config with validation."""
+        The in-memory config is updated right away; with background=True
+        the JSON serialization and disk write run on the config save pool.
+        """
         self._logger.info(f"[配置保存] 开始保存 {len(self._symbols)} 只股票")
 
         # Validate before saving
         for s in self._symbols:
-            if not isinstance(s, dict) or 'symbol' not in s:
+            if not isinstance(s, Symbol) or not s.symbol:
                 self._logger.error(f"[配置保存] 发现无效股票数据: {s}")
                 raise ValueError(f"Invalid symbol data: {s}")
 
-        self._config.set('symbols', self._symbols)
-        self._config.save()
-        self._logger.info(f"[配置保存] 成功保存到配置文件")
+        self._config.set('symbols', [s.to_dict() for s in self._symbols])
+        if background:
+            _CONFIG_SAVE_POOL.submit(self._write_config)
+        else:
+            self._write_config()
 
         # Reinitialize alert manager
         try:
@@ -387,144 +642,270 @@ class StockManagerFrame(wx.Frame):
         except Exception as e:
             self._logger.warning(f"[配置保存] 重新初始化告警管理器失败: {e}")
 
+    def _write_config(self):
+        """Write the config file; runs on the config save pool for debounced saves."""
+        if self._config.save():
+            self._logger.info("[配置保存] 成功保存到配置文件")
+        else:
+            self._logger.error("[配置保存] 写入配置文件失败")
+
+    def _schedule_save(self):
+        """Mark symbols dirty and write them once edits settle (500ms debounce)."""
+        self._symbols_dirty = True
+        # StartOnce on a running timer restarts it with the full delay
+        self._save_timer.StartOnce(500)
+
+    def _on_save_timer(self, event):
+        self._flush_symbols(True)
+
+    def _flush_symbols(self, background: bool = False):
+        """
+        Persist pending symbol changes, if any.
+
+        The debounce timer writes in the background; close and atexit
+        flush synchronously so the write finishes before teardown.
+        """
+        try:
+            self._save_timer.Stop()
+        except Exception:
+            pass
+
+        if not self._symbols_dirty:
+            return
+        self._symbols_dirty = False
+        try:
+            self._save_symbols(background)
+        except Exception as e:
+            self._logger.error(f"[配置保存] 保存失败: {e}", exc_info=True)
+
     def _get_filtered(self):
-        rows = list(self._symbols)
-        key = self._sort_key
-        rows.sort(key=lambda x: str(x.get(key, '')).lower(), reverse=not self._sort_asc)
-        return rows
+        if self._sorted_cache is None:
+            rows = list(self._symbols_by_code.values())
+            # One lowered key per symbol, then a plain itemgetter sort on the pairs
+            key = self._sort_key
+            decorated = [(str(getattr(s, key, '')).lower(), s) for s in rows]
+            decorated.sort(key=itemgetter(0), reverse=not self._sort_asc)
+            self._sorted_cache = [s for _, s in decorated]
+        # The table mutates its row list on delete, so hand out a copy
+        return list(self._sorted_cache)
+
+    def _invalidate_sort(self):
+        """Drop the cached sorted view after symbols or the sort order change."""
+        self._sorted_cache = None
 
     def _refresh_grid(self):
         """Refresh grid display with current symbols data and modern styling."""
-        self._logger.info(f"[刷新表格] 开始刷新，当前有 {len(self._symbols)} 只股票")
+        if not self.IsShown() or self.IsIconized():
+            # Nothing visible to update; refresh once the window comes back
+            self._dirty = True
+            return
+
+        self._logger.info(f"[刷新表格] 开始刷新，当前有 {len(self._symbols_by_code)} 只股票")
 
         rows = self._get_filtered()
         self._logger.info(f"[刷新表格] 过滤排序后有 {len(rows)} 行")
 
-        # Clear existing rows
-        while self._grid.GetNumberRows() > 0:
-            self._grid.DeleteRows(0)
+        cache = self._cache
+        adapter = self._adapter
 
-        # Add new rows
-        if rows:
-            self._grid.AppendRows(len(rows))
-            self._logger.info(f"[刷新表格] 已添加 {len(rows)} 行到表格")
+        price_by_code: Dict[str, str] = {}
+        color_by_code: Dict[str, wx.Colour] = {}
 
-        cache = getattr(self._app, 'cache_manager', None)
-        adapter = getattr(self._app, 'primary_adapter', None)
+        # Bind per-row lookups to locals once instead of re-resolving them each row
+        get_quote = cache.get if cache else None
+        rendered_quotes = self._rendered_quotes
 
-        for i, s in enumerate(rows):
-            code = s.get('symbol', '')
-            name = s.get('name', '')
-            price = ''
-            price_color = Colors.TEXT_PRIMARY
+        # Cache misses are fetched in the background; the grid renders now
+        missing: List[str] = []
 
-            # Try to get price from cache first
-            if cache:
-                q = cache.get(code)
+        for s in rows:
+            code = s.symbol
+
+            if get_quote:
+                q = get_quote(code)
                 if q and q.price is not None:
-                    price = f"{q.price:.3f}"
-                    # Color code based on change
-                    if hasattr(q, 'change_percent'):
-                        price_color = get_status_color(q.change_percent)
-                    self._logger.debug(f"[刷新表格] 行{i} {code}: 从缓存获取价格 {price}")
-                else:
-                    self._logger.info(f"[刷新表格] 行{i} {code}: 缓存中无价格数据，尝试从API获取")
-                    # If not in cache, try to fetch from API
-                    if adapter:
-                        try:
-                            quote = adapter.fetch_quote(code)
-                            if quote and quote.price is not None:
-                                price = f"{quote.price:.3f}"
-                                # Cache it for future use (use update() method)
-                                cache.update(quote)
-                                self._logger.info(f"[刷新表格] 行{i} {code}: 从API获取价格 {price}")
-                            else:
-                                self._logger.warning(f"[刷新表格] 行{i} {code}: API返回无效数据")
-                        except Exception as e:
-                            self._logger.error(f"[刷新表格] 行{i} {code}: 获取价格失败 - {e}")
+                    # Quotes are immutable and replaced on update, so the same
+                    # object means nothing moved: reuse last refresh's text and color
+                    prev = rendered_quotes.get(code)
+                    if prev is not None and prev[0] is q:
+                        price_text, color = prev[1], prev[2]
                     else:
-                        self._logger.warning(f"[刷新表格] 适配器不可用")
+                        price_text = format_price(q.price)
+                        # Color code based on change
+                        color = get_status_color(q.change_percent) if hasattr(q, 'change_percent') else None
+                        rendered_quotes[code] = (q, price_text, color)
+                    price_by_code[code] = price_text
+                    if color is not None:
+                        color_by_code[code] = color
+                else:
+                    missing.append(code)
+
+        if get_quote is None:
+            self._logger.warning("[刷新表格] 缓存管理器不可用")
+        elif missing:
+            if adapter:
+                self._dispatch_missing_fetch(missing, adapter, cache)
             else:
-                self._logger.warning(f"[刷新表格] 缓存管理器不可用")
+                self._logger.warning("[刷新表格] 适配器不可用")
 
-            # Set cell values
-            self._grid.SetCellValue(i, 0, code)
-            self._grid.SetCellValue(i, 1, name)
-            self._grid.SetCellValue(i, 2, price)
-            
-            # Format thresholds as comma-separated lists
-            up_thresholds = s.get('up_thresholds', [])
-            down_thresholds = s.get('down_thresholds', [])
-            up_str = ', '.join([str(t) for t in up_thresholds]) if up_thresholds else ''
-            down_str = ', '.join([str(t) for t in down_thresholds]) if down_thresholds else ''
-            
-            self._grid.SetCellValue(i, 3, up_str)
-            self._grid.SetCellValue(i, 4, down_str)
-            self._grid.SetCellValue(i, 5, str(s.get('duration_secs', '')))
-            self._grid.SetCellValue(i, 6, "✏️ 编辑")
-            self._grid.SetCellValue(i, 7, "🗑️ 删除")
-
-            # Apply modern cell styling
-            # Code column - bold
-            self._grid.SetCellFont(i, 0, Typography.body())
-            self._grid.SetCellTextColour(i, 0, Colors.TEXT_PRIMARY)
-
-            # Name column
-            self._grid.SetCellTextColour(i, 1, Colors.TEXT_PRIMARY)
-
-            # Price column - color coded and highlighted
-            self._grid.SetCellBackgroundColour(i, 2, Colors.INFO_LIGHT)
-            self._grid.SetCellTextColour(i, 2, price_color)
-            self._grid.SetCellFont(i, 2, Typography.body())
-
-            # Threshold columns
-            self._grid.SetCellTextColour(i, 3, Colors.SUCCESS_DARK)
-            self._grid.SetCellTextColour(i, 4, Colors.ERROR_DARK)
-
-            # Duration column
-            self._grid.SetCellTextColour(i, 5, Colors.TEXT_SECONDARY)
-
-            # Edit button - primary color
-            self._grid.SetCellBackgroundColour(i, 6, Colors.PRIMARY_100)
-            self._grid.SetCellTextColour(i, 6, Colors.PRIMARY_700)
-            self._grid.SetCellAlignment(i, 6, wx.ALIGN_CENTER, wx.ALIGN_CENTER)
-
-            # Delete button - error color
-            self._grid.SetCellBackgroundColour(i, 7, Colors.ERROR_LIGHT)
-            self._grid.SetCellTextColour(i, 7, Colors.ERROR_DARK)
-            self._grid.SetCellAlignment(i, 7, wx.ALIGN_CENTER, wx.ALIGN_CENTER)
-
-            # Set read-only cells
-            self._grid.SetReadOnly(i, 0, True)
-            self._grid.SetReadOnly(i, 1, True)
-            self._grid.SetReadOnly(i, 2, True)
-            self._grid.SetReadOnly(i, 6, True)
-            self._grid.SetReadOnly(i, 7, True)
+        # Swap the data in and let the grid pull only the visible cells
+        self._apply_table_data(rows, price_by_code, color_by_code)
 
         # Update stats label
         self._update_stats_label()
 
-        self._logger.info(f"[刷新表格] 表格刷新完成")
+        self._logger.info("[刷新表格] 表格刷新完成")
+
+    def _dispatch_missing_fetch(self, codes: List[str], adapter, cache):
+        """Queue a background fetch for cache misses not already in flight."""
+        codes = [code for code in codes if code not in self._inflight_fetches]
+        if not codes:
+            return
+        self._inflight_fetches.update(codes)
+        self._logger.info(f"[刷新表格] {len(codes)} 只股票缓存中无价格数据，后台从API获取")
+        self._executor.submit(self._fetch_missing_async, codes, adapter, cache)
+
+    def _fetch_missing_async(self, codes: List[str], adapter, cache):
+        """Fetch missing quotes on a worker thread, then request one coalesced repaint."""
+        fetched = 0
+        for code in codes:
+            try:
+                quote = adapter.fetch_quote(code)
+                if quote and quote.price is not None:
+                    cache.update(quote)
+                    fetched += 1
+                else:
+                    self._logger.warning(f"[刷新表格] {code}: API返回无效数据")
+            except Exception as e:
+                self._logger.error(f"[刷新表格] {code}: 获取价格失败 - {e}")
+            finally:
+                self._inflight_fetches.discard(code)
+
+        # Only repaint when something arrived, so failures don't loop refresh->fetch
+        if fetched:
+            wx.CallAfter(self.request_refresh)
+
+    def request_refresh(self):
+        """
+        Request a grid refresh, coalescing bursts into one repaint.
+
+        Every request within the 100ms window collapses into a single
+        trailing _refresh_grid call. The bursts come from user actions and
+        their completions (save, delete, background quote fetches landing
+        together), which arrive within milliseconds of each other; 100ms
+        is short enough not to be noticed. Must be called on the UI thread.
+        """
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        wx.CallLater(100, self._refresh_grid_if_pending)
+
+    def _refresh_grid_if_pending(self):
+        if not self._refresh_pending or not self:
+            return
+        self._refresh_pending = False
+        self._refresh_grid()
+
+    def _remove_grid_row(self, code: str):
+        """Remove a single row from the grid without rebuilding the rest."""
+        row = self._table.remove_row(code)
+        if row is None:
+            self.request_refresh()
+            return
+
+        # Freeze as well as batch: the row shift also resizes the scrollbars,
+        # and neither step should paint before the delete is complete
+        self._grid.Freeze()
+        self._grid.BeginBatch()
+        try:
+            msg = gridlib.GridTableMessage(
+                self._table, gridlib.GRIDTABLE_NOTIFY_ROWS_DELETED, row, 1
+            )
+            self._grid.ProcessTableMessage(msg)
+        finally:
+            self._grid.EndBatch()
+            self._grid.Thaw()
+        self._update_stats_label()
+
+    def _apply_table_data(self, rows: List[Symbol], price_by_code: Dict[str, str],
+                          color_by_code: Dict[str, wx.Colour]):
+        """
+        Swap new data into the table and notify the grid in a single batch.
+
+        The swap, the row-count change (one ROWS_APPENDED/DELETED message
+        for the whole difference) and the value refresh all happen inside
+        one BeginBatch/EndBatch, so the grid repaints once at EndBatch.
+        When the row set is unchanged only the rows whose content differs
+        are invalidated, and nothing is repainted if no row changed.
+        """
+        table = self._table
+        self._grid.BeginBatch()
+        try:
+            old_count = table.GetNumberRows()
+            changed = table.set_data(rows, price_by_code, color_by_code)
+            if changed is not None:
+                self._refresh_rows(changed)
+                return
+
+            # Row count/order changed: also freeze the native window so the
+            # scrollbar and layout updates don't paint until Thaw
+            self._grid.Freeze()
+            try:
+                new_count = len(rows)
+                if new_count > old_count:
+                    msg = gridlib.GridTableMessage(
+                        table, gridlib.GRIDTABLE_NOTIFY_ROWS_APPENDED, new_count - old_count
+                    )
+                    self._grid.ProcessTableMessage(msg)
+                elif new_count < old_count:
+                    msg = gridlib.GridTableMessage(
+                        table, gridlib.GRIDTABLE_NOTIFY_ROWS_DELETED, new_count, old_count - new_count
+                    )
+                    self._grid.ProcessTableMessage(msg)
+
+                msg = gridlib.GridTableMessage(table, gridlib.GRIDTABLE_REQUEST_VIEW_GET_VALUES)
+                self._grid.ProcessTableMessage(msg)
+            finally:
+                self._grid.Thaw()
+        finally:
+            self._grid.EndBatch()
+
+    def _refresh_rows(self, changed: List[int]):
+        """Invalidate just the changed rows; falls back to a full value refresh."""
+        if not changed:
+            return
+        refresh_block = getattr(self._grid, 'RefreshBlock', None)
+        if refresh_block is None or len(changed) > 20:
+            msg = gridlib.GridTableMessage(self._table, gridlib.GRIDTABLE_REQUEST_VIEW_GET_VALUES)
+            self._grid.ProcessTableMessage(msg)
+            return
+        for row in changed:
+            refresh_block(row, 0, row, COL_DELETE)
 
     def _update_stats_label(self):
         """Update the stats label with current information."""
-        total = len(self._symbols)
-        cache = getattr(self._app, 'cache_manager', None)
+        total = len(self._symbols_by_code)
+        cache = self._cache
 
         if cache:
-            stats = cache.get_cache_stats()
-            hit_rate = stats.get('hit_rate', 0)
-            self._stats_label.SetLabel(
-                f"总计: {total} 只股票 | 缓存命中率: {hit_rate:.1f}%"
-            )
+            # get_cache_stats walks every entry under the cache lock; sample it at most once a second
+            now = time.monotonic()
+            if self._hit_rate is None or now - self._hit_rate_ts >= 1.0:
+                self._hit_rate = cache.get_cache_stats().get('hit_rate', 0)
+                self._hit_rate_ts = now
+            label = f"总计: {total} 只股票 | 缓存命中率: {self._hit_rate:.1f}%"
         else:
-            self._stats_label.SetLabel(f"总计: {total} 只股票")
+            label = f"总计: {total} 只股票"
 
+        # SetLabel relayouts the toolbar, so skip it when the text is unchanged
+        if label != self._last_stats_label:
+            self._stats_label.SetLabel(label)
+            self._last_stats_label = label
 
 
     def _on_label_click(self, event):
         col = event.GetCol()
-        mapping = {0: 'symbol', 1: 'name'}
+        mapping = {COL_CODE: 'symbol', COL_NAME: 'name'}
         if col in mapping:
             key = mapping[col]
             if self._sort_key == key:
@@ -532,122 +913,25 @@ class StockManagerFrame(wx.Frame):
             else:
                 self._sort_key = key
                 self._sort_asc = True
-            self._refresh_grid()
+            self._invalidate_sort()
+            self.request_refresh()
         event.Skip()
 
-    def _on_grid_right_click(self, event):
-        """Handle right-click on grid cells."""
-        try:
-            print("\n" + "=" * 80)
-            print("[DEBUG] _on_grid_right_click() 被调用！")
-            print(f"[DEBUG] 事件类型: {event.GetEventType()}")
-            print(f"[DEBUG] 行: {event.GetRow()}, 列: {event.GetCol()}")
-
-            self._logger.info("=" * 60)
-            self._logger.info("[右键菜单] 单元格右键点击事件触发")
-            self._logger.info(f"[右键菜单] 事件类型: {event.GetEventType()}")
-            self._logger.info(f"[右键菜单] 行: {event.GetRow()}, 列: {event.GetCol()}")
-
-            # Pause floating window guard to prevent interference
-            print("[DEBUG] 暂停浮动窗口守护...")
-            self._pause_floating_window_guard()
-
-            # Show context menu
-            print("[DEBUG] 调用 _show_context_menu()...")
-            self._show_context_menu()
-
-            print("[DEBUG] 单元格右键处理完成")
-            print("=" * 80 + "\n")
-            self._logger.info("[右键菜单] 单元格右键处理完成")
-        except Exception as e:
-            print(f"[DEBUG] 异常！{e}")
-            import traceback
-            traceback.print_exc()
-            self._logger.error(f"[右键菜单] 单元格右键处理异常: {e}", exc_info=True)
-
-    def _on_grid_context_menu(self, event):
-        """Handle context menu event on empty grid space."""
-        try:
-            print("\n" + "=" * 80)
-            print("[DEBUG] _on_grid_context_menu() 被调用！")
-            print(f"[DEBUG] 事件类型: {event.GetEventType()}")
-
-            self._logger.info("=" * 60)
-            self._logger.info("[右键菜单] 网格空白区域上下文菜单事件触发")
-            self._logger.info(f"[右键菜单] 事件类型: {event.GetEventType()}")
-
-            # Pause floating window guard to prevent interference
-            print("[DEBUG] 暂停浮动窗口守护...")
-            self._pause_floating_window_guard()
-
-            # Show context menu
-            print("[DEBUG] 调用 _show_context_menu()...")
-            self._show_context_menu()
-
-            print("[DEBUG] 网格空白区域右键处理完成")
-            print("=" * 80 + "\n")
-            self._logger.info("[右键菜单] 网格空白区域右键处理完成")
-        except Exception as e:
-            print(f"[DEBUG] 异常！{e}")
-            import traceback
-            traceback.print_exc()
-            self._logger.error(f"[右键菜单] 网格空白区域右键处理异常: {e}", exc_info=True)
-
-    def _on_panel_context_menu(self, event):
-        """Handle context menu event on panel."""
-        try:
-            print("\n" + "=" * 80)
-            print("[DEBUG] _on_panel_context_menu() 被调用！")
-            print(f"[DEBUG] 事件类型: {event.GetEventType()}")
-
-            self._logger.info("=" * 60)
-            self._logger.info("[右键菜单] 面板上下文菜单事件触发")
-            self._logger.info(f"[右键菜单] 事件类型: {event.GetEventType()}")
-
-            # Pause floating window guard to prevent interference
-            print("[DEBUG] 暂停浮动窗口守护...")
-            self._pause_floating_window_guard()
-
-            # Show context menu
-            print("[DEBUG] 调用 _show_context_menu()...")
-            self._show_context_menu()
-
-            print("[DEBUG] 面板右键处理完成")
-            print("=" * 80 + "\n")
-            self._logger.info("[右键菜单] 面板右键处理完成")
-        except Exception as e:
-            print(f"[DEBUG] 异常！{e}")
-            import traceback
-            traceback.print_exc()
-            self._logger.error(f"[右键菜单] 面板右键处理异常: {e}", exc_info=True)
+    def _on_any_context_menu(self, event):
+        """
+        Handle right-clicks from the grid cells, grid window, panel and frame.
 
-    def _on_frame_context_menu(self, event):
-        """Handle context menu event on frame."""
+        One click can reach several of these sources as the event
+        propagates; the 250ms throttle lets only the first one open a menu.
+        """
+        if not self._debouncer.allow("context_menu", 250):
+            return
         try:
-            print("\n" + "=" * 80)
-            print("[DEBUG] _on_frame_context_menu() 被调用！")
-            print(f"[DEBUG] 事件类型: {event.GetEventType()}")
-
-            self._logger.info("=" * 60)
-            self._logger.info("[右键菜单] 窗口上下文菜单事件触发")
-            self._logger.info(f"[右键菜单] 事件类型: {event.GetEventType()}")
-
             # Pause floating window guard to prevent interference
-            print("[DEBUG] 暂停浮动窗口守护...")
             self._pause_floating_window_guard()
-
-            # Show context menu
-            print("[DEBUG] 调用 _show_context_menu()...")
             self._show_context_menu()
-
-            print("[DEBUG] 窗口右键处理完成")
-            print("=" * 80 + "\n")
-            self._logger.info("[右键菜单] 窗口右键处理完成")
         except Exception as e:
-            print(f"[DEBUG] 异常！{e}")
-            import traceback
-            traceback.print_exc()
-            self._logger.error(f"[右键菜单] 窗口右键处理异常: {e}", exc_info=True)
+            self._logger.error(f"[右键菜单] 右键处理异常: {e}", exc_info=True)
 
     def _show_context_menu(self):
         """Show context menu with Add Stock option."""
@@ -655,58 +939,22 @@ class StockManagerFrame(wx.Frame):
         self._menu_item_clicked = False
 
         try:
-            print("[DEBUG] _show_context_menu() 开始执行")
-            self._logger.info("[右键菜单] 开始创建上下文菜单")
-
-            # Create menu
-            print("[DEBUG] 创建 wx.Menu()...")
-            menu = wx.Menu()
-            print(f"[DEBUG] 菜单对象已创建: {menu}")
-            self._logger.info("[右键菜单] 菜单对象已创建")
-
-            # Add menu item
-            print("[DEBUG] 添加菜单项...")
-            add_item = menu.Append(wx.ID_ANY, "添加股票")
-            print(f"[DEBUG] 菜单项已添加，ID: {add_item.GetId()}")
-            self._logger.info(f"[右键菜单] 菜单项已添加，ID: {add_item.GetId()}")
-
-            # Bind menu item event
-            print("[DEBUG] 绑定菜单项事件...")
-            self.Bind(wx.EVT_MENU, self._on_add_from_menu, add_item)
-            print("[DEBUG] 菜单项事件已绑定")
-            self._logger.info("[右键菜单] 菜单项事件已绑定")
-
-            # Show menu at cursor position
-            print("[DEBUG] 准备显示菜单...")
-            self._logger.info("[右键菜单] 准备显示菜单...")
-            self.PopupMenu(menu)
-            print("[DEBUG] PopupMenu 调用完成")
-            self._logger.info("[右键菜单] PopupMenu 调用完成")
-
-            # Destroy menu after it's closed
-            menu.Destroy()
-            print("[DEBUG] 菜单已销毁")
-            self._logger.info("[右键菜单] 菜单已销毁")
-
-            # Resume guard after menu closes, but only if no dialog will be shown
-            # If user clicked "添加股票", _on_add() will manage the guard lifecycle
-            # Use a short delay to allow menu item handler to set the flag
-            def _check_and_resume():
-                if not self._menu_item_clicked:
-                    self._logger.info("[右键菜单] 菜单关闭且无对话框，恢复浮动窗口守护")
-                    self._resume_floating_window_guard()
-                else:
-                    self._logger.info("[右键菜单] 菜单关闭但将显示对话框，守护恢复由对话框处理")
-
-            wx.CallLater(100, _check_and_resume)
-
+            # PopupMenu is modal and dispatches the chosen item's EVT_MENU
+            # before returning, so the flag is final once it returns
+            self.PopupMenu(self._context_menu)
         except Exception as e:
-            print(f"[DEBUG] _show_context_menu() 异常！{e}")
-            import traceback
-            traceback.print_exc()
             self._logger.error(f"[右键菜单] 显示菜单异常: {e}", exc_info=True)
             # On error, resume guard to be safe
-            wx.CallLater(500, self._resume_floating_window_guard)
+            self._menu_item_clicked = False
+        self._on_context_menu_closed()
+
+    def _on_context_menu_closed(self):
+        """Resume the guard once the context menu is gone, unless a dialog took over."""
+        if not self._menu_item_clicked:
+            self._logger.debug("[右键菜单] 菜单关闭且无对话框，恢复浮动窗口守护")
+            self._resume_floating_window_guard()
+        else:
+            self._logger.debug("[右键菜单] 菜单关闭但将显示对话框，守护恢复由对话框处理")
 
     def _on_add_from_menu(self, event):
         """Handle add stock from context menu."""
@@ -739,43 +987,63 @@ class StockManagerFrame(wx.Frame):
     def _on_close(self, event):
         """Handle window close event."""
         self._logger.info("[股票管理] 关闭窗口")
+        self._flush_symbols()
+        atexit.unregister(self._flush_symbols)
+        self._refresh_pending = False
+        self._executor.shutdown(wait=False)
+        # Popup menus are not owned by the frame, so free it explicitly
+        self._context_menu.Destroy()
         self._resume_floating_window_guard()
         self.Destroy()
 
+    def _on_show(self, event):
+        """Run a deferred refresh when the window becomes visible."""
+        if event.IsShown() and self._dirty:
+            self._dirty = False
+            self.request_refresh()
+        event.Skip()
+
+    def _on_iconize(self, event):
+        """Run a deferred refresh when the window is restored."""
+        if not event.IsIconized() and self._dirty:
+            self._dirty = False
+            self.request_refresh()
+        event.Skip()
+
     def _on_refresh_click(self, event):
         """Handle refresh button click."""
         self._logger.info("[刷新] 手动刷新表格")
-        self._refresh_grid()
-        show_toast("✅ 刷新完成", "success", 2000)
+        self.request_refresh()
+        self._info("✅ 刷新完成")
 
     def _on_add(self, event):
-        self._logger.info("[添加股票] 按钮被点击，开始添加流程")
+        self._logger.debug("[添加股票] 按钮被点击，开始添加流程")
 
         # Check debouncer - reduced to 500ms for better responsiveness
         if not self._debouncer.allow("add", 500):
             self._logger.warning("[添加股票] 操作过于频繁，已被防抖器拦截")
             return
 
-        self._logger.info("[添加股票] 通过防抖检查，创建现代输入对话框")
+        self._logger.debug("[添加股票] 通过防抖检查，创建现代输入对话框")
 
         # Pause floating window guard before showing dialog
-        self._logger.info("[添加股票] 暂停浮动窗口守护")
+        self._logger.debug("[添加股票] 暂停浮动窗口守护")
         self._pause_floating_window_guard()
 
         try:
             # Create modern dialog
             dlg = ModernAddDialog(self)
 
-            self._logger.info("[添加股票] 显示对话框")
+            self._logger.debug("[添加股票] 显示对话框")
             result = dlg.ShowModal()
-            self._logger.info(f"[添加股票] 对话框关闭，结果: {result}")
+            self._logger.debug("[添加股票] 对话框关闭，结果: %s", result)
 
             if result == wx.ID_OK:
-                self._logger.info("[添加股票] 用户点击确定")
+                self._logger.debug("[添加股票] 用户点击确定")
                 code = dlg.get_code()
                 dlg.Destroy()
 
-                self._logger.info(f"[添加股票] 获取到股票代码: {code}")
+                self._logger.debug("[添加股票] 获取到股票代码: %s", code)
 
                 # Validate input
                 if not code:
@@ -784,85 +1052,27 @@ class StockManagerFrame(wx.Frame):
                     return
 
                 # Check duplicate
-                if any(s.get('symbol') == code for s in self._symbols):
+                if code in self._symbols_by_code:
                     self._logger.warning(f"[添加股票] 股票代码已存在: {code}")
                     self._error("代码已存在")
                     return
 
-                self._logger.info(f"[添加股票] 开始验证股票代码: {code}")
-
-                # Define add operation
-                def do_add():
-                    self._logger.info(f"[添加股票] 执行添加操作: {code}")
-                    adapter = getattr(self._app, 'primary_adapter', None)
-                    if adapter is None:
-                        self._logger.error("[添加股票] 适配器未初始化")
-                        raise Exception("适配器未初始化")
-
-                    self._logger.info(f"[添加股票] 调用API获取股票信息: {code}")
-                    quote = adapter.fetch_quote(code)
-
-                    if not quote:
-                        self._logger.error(f"[添加股票] 股票代码不存在: {code}")
-                        raise Exception("股票代码不存在，请重新输入")
+                action_key = f"add:{code}"
+                if not self._begin_action(action_key):
+                    self._logger.warning(f"[添加股票] 正在添加中: {code}")
+                    self._error("该代码正在添加中")
+                    return
 
-                    name = quote.name
-                    price = quote.price if quote.price is not None else 0.0
-                    self._logger.info(f"[添加股票] 获取到股票信息: {name}, 价格: {price}")
+                self._logger.debug("[添加股票] 开始验证股票代码: %s", code)
 
-                    # Cache the quote immediately so it shows in the grid (use update() method)
-                    cache = getattr(self._app, 'cache_manager', None)
-                    if cache:
-                        cache.update(quote)
-                        self._logger.info(f"[添加股票] 已缓存股票数据: {code}")
-                    else:
-                        self._logger.warning(f"[添加股票] 缓存管理器不可用，价格可能不显示")
-
-                    # Add to symbols list
-                    new_symbol = {
-                        'symbol': code,
-                        'name': name,
-                        'up_thresholds': [],
-                        'down_thresholds': [],
-                        'duration_secs': 5
-                    }
-                    self._symbols.append(new_symbol)
-                    self._logger.info(f"[添加股票] 添加到内存列表: {new_symbol}")
-
-                    # Save to config
-                    self._save_symbols()
-                    self._logger.info(f"[添加股票] 保存到配置文件")
-
-                    # Update data fetcher with all symbol codes
-                    symbol_codes = [s.get('symbol') for s in self._symbols]
-                    self._app.data_fetcher.update_etf_list(symbol_codes)
-                    self._logger.info(f"[添加股票] 更新数据获取器，共 {len(symbol_codes)} 只股票")
-
-                    # Refresh grid to show the new stock with price
-                    wx.CallAfter(self._refresh_grid)
-                    self._logger.info(f"[添加股票] 刷新界面")
-
-                # Execute in background thread
-                import threading
-                def _runner():
-                    err = None
-                    try:
-                        do_add()
-                    except Exception as e:
-                        err = e
-                        self._logger.error(f"[添加股票] 执行失败: {e}", exc_info=True)
-
-                    def _finish():
-                        if err is None:
-                            self._info("添加成功")
-                        else:
-                            self._error(f"添加失败：{err}")
-
-                    wx.CallAfter(_finish)
-
-                threading.Thread(target=_runner, daemon=True).start()
+                # Only the network fetch runs on the worker; all state changes
+                # happen in _finish_add on the UI thread
+                future = self._executor.submit(self._fetch_quote_for_add, code)
+                future.add_done_callback(
+                    lambda f: wx.CallAfter(self._finish_add, code, action_key, f)
+                )
             else:
-                self._logger.info("[添加股票] 用户取消操作")
+                self._logger.debug("[添加股票] 用户取消操作")
                 dlg.Destroy()
 
         except Exception as e:
@@ -871,48 +1081,125 @@ class StockManagerFrame(wx.Frame):
         finally:
             # CRITICAL: Resume guard AFTER dialog is completely closed
             # Use CallLater to ensure dialog is fully destroyed before resuming
-            self._logger.info("[添加股票] 延迟恢复浮动窗口守护（500ms后）")
+            self._logger.debug("[添加股票] 延迟恢复浮动窗口守护（500ms后）")
             wx.CallLater(500, self._resume_floating_window_guard)
 
+    def _fetch_quote_for_add(self, code: str):
+        """Fetch and validate the quote for a new code (runs on the worker pool)."""
+        self._logger.debug("[添加股票] 执行添加操作: %s", code)
+        adapter = self._adapter
+        if adapter is None:
+            self._logger.error("[添加股票] 适配器未初始化")
+            raise Exception("适配器未初始化")
+
+        self._logger.debug("[添加股票] 调用API获取股票信息: %s", code)
+        quote = adapter.fetch_quote(code)
+
+        if not quote:
+            self._logger.error(f"[添加股票] 股票代码不存在: {code}")
+            raise Exception("股票代码不存在，请重新输入")
+        return quote
+
+    def _finish_add(self, code: str, action_key: str, future):
+        """Apply a finished add on the UI thread: cache, symbols, save, fetcher, grid."""
+        self._end_action(action_key)
+        if not self:
+            return
+
+        err = future.exception()
+        if err is not None:
+            self._logger.error(f"[添加股票] 执行失败: {err}", exc_info=err)
+            self._error(f"添加失败：{err}")
+            return
+
+        quote = future.result()
+        name = quote.name
+        price = quote.price if quote.price is not None else 0.0
+        self._logger.debug("[添加股票] 获取到股票信息: %s, 价格: %s", name, price)
+
+        # Cache the quote immediately so it shows in the grid (use update() method)
+        cache = self._cache
+        if cache:
+            cache.update(quote)
+            self._logger.debug("[添加股票] 已缓存股票数据: %s", code)
+        else:
+            self._logger.warning("[添加股票] 缓存管理器不可用，价格可能不显示")
+
+        # Add to symbols list
+        new_symbol = Symbol.new(code, name)
+        self._symbols_by_code[code] = new_symbol
+        self._invalidate_sort()
+        self._logger.info("[添加股票] 添加到内存列表: %s (%s)", code, name)
+
+        # Save to config
+        self._schedule_save()
+        self._logger.info("[添加股票] 保存到配置文件")
+
+        # Tell the data fetcher about the new code only, on the same
+        # ordered pool as deletes so add/delete of one code can't reorder
+        fetcher = getattr(self._app, "data_fetcher", None)
+        if fetcher:
+            _FETCHER_UPDATE_POOL.submit(self._update_fetcher_codes, fetcher, (code,), ())
+        self._logger.debug("[添加股票] 更新数据获取器，共 %d 只股票", len(self._symbols_by_code))
+
+        # Refresh grid to show the new stock with price
+        self.request_refresh()
+        self._info("添加成功")
+
+    def _begin_action(self, key: str) -> bool:
+        """Claim an action key; False if the same action is already running."""
+        with self._inflight_lock:
+            if key in self._inflight_actions:
+                return False
+            self._inflight_actions.add(key)
+            return True
+
+    def _end_action(self, key: str):
+        """Release an action key claimed by _begin_action."""
+        with self._inflight_lock:
+            self._inflight_actions.discard(key)
+
     def _on_cell_click(self, event):
         row = event.GetRow()
         col = event.GetCol()
 
         # Handle Edit button click (column 6)
-        if col == 6:
+        if col == COL_EDIT:
             self._on_edit_row(row)
             # Don't skip event for button clicks to prevent duplicate triggers
             return
         # Handle Delete button click (column 7)
-        elif col == 7:
+        elif col == COL_DELETE:
             self._on_delete_row(row)
             # Don't skip event for button clicks to prevent duplicate triggers
             return
         # Handle editable cells (columns 3, 4, 5)
-        elif col in [3, 4, 5]:
+        elif col in [COL_UP, COL_DOWN, COL_DURATION]:
             self._grid.EnableCellEditControl()
 
         event.Skip()
 
     def _on_edit_row(self, row):
         """Handle edit row action with modern dialog."""
-        if not self._debouncer.allow("edit", 300):
+        code = self._grid.GetCellValue(row, COL_CODE)
+        s = self._symbols_by_code.get(code)
+        if not s:
             return
 
-        code = self._grid.GetCellValue(row, 0)
-        s = next((x for x in self._symbols if x.get('symbol') == code), None)
-        if not s:
+        action_key = f"edit:{code}"
+        if not self._begin_action(action_key):
+            self._logger.warning(f"[编辑股票] 正在编辑中，忽略重复点击: {code}")
             return
 
         # Pause floating window guard before showing dialog
-        self._logger.info("[编辑股票] 暂停浮动窗口守护")
+        self._logger.debug("[编辑股票] 暂停浮动窗口守护")
         self._pause_floating_window_guard()
 
         try:
             # Create modern edit dialog
-            dlg = ModernEditDialog(self, s)
+            dlg = ModernEditDialog(self, s.to_dict())
 
-            self._logger.info("[编辑股票] 显示对话框")
+            self._logger.debug("[编辑股票] 显示对话框")
             result = dlg.ShowModal()
 
             if result == wx.ID_OK:
@@ -920,17 +1207,17 @@ class StockManagerFrame(wx.Frame):
                 values = dlg.get_values()
 
                 # Update symbol data
-                s['up_thresholds'] = values['up_thresholds']
-                s['down_thresholds'] = values['down_thresholds']
-                s['duration_secs'] = values['duration_secs']
+                s.up_thresholds = values['up_thresholds']
+                s.down_thresholds = values['down_thresholds']
+                s.duration_secs = values['duration_secs']
 
-                self._logger.info(f"[编辑股票] 更新配置: {code} -> {values}")
+                self._logger.info("[编辑股票] 更新配置: %s -> %s", code, values)
 
                 # Save and refresh
-                self._save_symbols()
-                self._refresh_grid()
+                self._schedule_save()
+                self.request_refresh()
 
-                show_toast("✅ 配置已保存", "success", 2000)
+                self._info("✅ 配置已保存")
 
             dlg.Destroy()
         except Exception as e:
@@ -938,8 +1225,10 @@ class StockManagerFrame(wx.Frame):
             self._error(f"编辑失败：{e}")
         finally:
             # Resume guard after dialog is completely closed
-            self._logger.info("[编辑股票] 延迟恢复浮动窗口守护（500ms后）")
+            self._logger.debug("[编辑股票] 延迟恢复浮动窗口守护（500ms后）")
             wx.CallLater(500, self._resume_floating_window_guard)
+            # Release after clicks queued behind the modal dialog have been handled
+            wx.CallAfter(self._end_action, action_key)
 
     def _on_delete_row(self, row):
         """处理表格中的"删除"点击。
@@ -948,63 +1237,89 @@ class StockManagerFrame(wx.Frame):
         - 点击"是"后：删除内存中的股票、保存配置、更新数据抓取列表、刷新表格
         - 点击"否"后：直接关闭对话框，不做任何修改
         """
-        # Use a unique key for each delete operation to prevent race conditions
-        delete_key = f"delete_{row}"
-        if not self._debouncer.allow(delete_key, 1000):
-            self._logger.warning(f"[删除股票] 防抖拦截: 行 {row}")
-            return
+        code = self._grid.GetCellValue(row, COL_CODE)
+        name = self._grid.GetCellValue(row, COL_NAME)
 
-        code = self._grid.GetCellValue(row, 0)
-        name = self._grid.GetCellValue(row, 1)
+        # One delete per code at a time; the first click runs immediately
+        action_key = f"delete:{code}"
+        if not self._begin_action(action_key):
+            self._logger.warning(f"[删除股票] 正在删除中，忽略重复点击: {code}")
+            return
 
         # Pause floating window guard before showing dialog
-        self._logger.info("[删除股票] 暂停浮动窗口守护")
+        self._logger.debug("[删除股票] 暂停浮动窗口守护")
         self._pause_floating_window_guard()
 
         try:
-            self._logger.info(f"[删除股票] 准备删除: {name} ({code})")
+            self._logger.debug("[删除股票] 准备删除: %s (%s)", name, code)
             # 同步确认对话框，在主线程执行
             if not self._confirm(f"确认删除股票 {name} ({code})?"):
-                self._logger.info("[删除股票] 用户取消删除")
-                # Resume guard immediately if user cancels
-                wx.CallLater(100, self._resume_floating_window_guard)
+                self._logger.debug("[删除股票] 用户取消删除")
                 return
 
             # 真正执行删除逻辑（同步执行即可，数据量很小）
-            self._symbols = [s for s in self._symbols if s.get('symbol') != code]
-            self._save_symbols()
+            self._symbols_by_code.pop(code, None)
+            self._rendered_quotes.pop(code, None)
+            self._invalidate_sort()
+            self._schedule_save()
 
-            # 更新数据抓取器监控的代码列表
-            try:
-                if hasattr(self._app, "data_fetcher") and self._app.data_fetcher:
-                    symbol_codes = [x.get('symbol') for x in self._symbols]
-                    self._app.data_fetcher.update_etf_list(symbol_codes)
-            except Exception as e:
-                # 更新失败不影响配置保存和界面刷新，只做日志记录
-                self._logger.warning(f"[删除股票] 更新数据抓取器失败: {e}")
+            # 更新数据抓取器监控的代码列表（后台执行，不阻塞界面）
+            fetcher = getattr(self._app, "data_fetcher", None)
+            if fetcher:
+                _FETCHER_UPDATE_POOL.submit(self._update_fetcher_codes, fetcher, (), (code,))
 
-            # 刷新表格
-            self._refresh_grid()
+            # 只删除表格中的这一行，无需整表刷新
+            self._remove_grid_row(code)
 
             self._info("删除成功")
-            get_logger(__name__).info(f"delete {code}")
+            self._logger.info("[删除股票] 已删除: %s", code)
         except Exception as e:
             self._logger.error(f"[删除股票] 执行失败: {e}", exc_info=True)
             self._error(f"删除失败：{e}")
         finally:
-            # Resume guard after dialog is completely closed
-            self._logger.info("[删除股票] 延迟恢复浮动窗口守护（500ms后）")
-            wx.CallLater(500, self._resume_floating_window_guard)
+            # ShowModal has returned, so the dialog is closed; resume on the next
+            # event-loop pass instead of waiting a fixed delay
+            self._logger.debug("[删除股票] 对话框已关闭，恢复浮动窗口守护")
+            wx.CallAfter(self._resume_floating_window_guard)
+            wx.CallAfter(self._end_action, action_key)
+
+    def _update_fetcher_codes(self, fetcher, added, removed):
+        """Apply a monitored-code delta to the data fetcher (runs on the update pool)."""
+        try:
+            fetcher.apply_etf_delta(added=added, removed=removed)
+        except Exception as e:
+            # 更新失败不影响配置保存和界面刷新，只做日志记录
+            self._logger.warning(f"[数据抓取器] 更新监控列表失败 (+{list(added)} -{list(removed)}): {e}")
 
     # 统一提示/加载态
     def _info(self, msg: str, title: str = "提示"):
-        show_toast(msg, "success", 2500)
+        self._queue_toast("success", msg)
 
     def _error(self, msg: str, title: str = "错误"):
-        show_toast(msg, "error", 2500)
+        self._queue_toast("error", msg)
+
+    def _queue_toast(self, kind: str, msg: str):
+        """Collect toasts for 150ms so a burst shows as a single banner."""
+        self._pending_toasts[kind].append(msg)
+        if self._toast_timer is not None:
+            self._toast_timer.Stop()
+        self._toast_timer = wx.CallLater(150, self._flush_toasts)
+
+    def _flush_toasts(self):
+        """Show one toast covering every pending message; errors set its style."""
+        self._toast_timer = None
+        pending, self._pending_toasts = self._pending_toasts, defaultdict(list)
+        parts = []
+        for kind, label in (("error", "失败"), ("success", "成功")):
+            msgs = pending.get(kind)
+            if not msgs:
+                continue
+            if len(msgs) > 1:
+                parts.append(f"{len(msgs)} 条{label}: {msgs[0]}…")
+            else:
+                parts.append(msgs[0])
+        if parts:
+            show_toast("\n".join(parts), "error" if pending.get("error") else "success", 2500)
 
     def _confirm(self, msg: str, title: str = "确认") -> bool:
-        dlg = wx.MessageDialog(self, msg, title, wx.YES_NO | wx.NO_DEFAULT | wx.ICON_WARNING)
-        res = dlg.ShowModal()
-        dlg.Destroy()
-        return res == wx.ID_YES
+        return wx.MessageBox(msg, title, wx.YES_NO | wx.NO_DEFAULT | wx.ICON_WARNING, self) == wx.YES
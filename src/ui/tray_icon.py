@@ -5,7 +5,6 @@ Provides the main user interface through Windows system tray.
 """
 
 import os
-import threading
 import time
 from typing import Optional, Dict, Callable
 from pathlib import Path
@@ -17,7 +16,7 @@ from ..utils.logger import get_logger
 from ..utils.helpers import (
     format_percent_with_arrow, 
     is_trading_time, 
-    get_next_trading_time
+    get_trading_status
 )
 from ..data.models import ETFQuote
 
@@ -59,23 +58,46 @@ class ETFTrayIcon(wx.adv.TaskBarIcon):
         # ETF data
         self._etf_data: Dict[str, ETFQuote] = {}
         self._etf_codes: list = []
+        self._code_to_index: Dict[str, int] = {}
+        # code -> tooltip text without the time-dependent trading status
+        self._formatted_tooltips: Dict[str, str] = {}
         self._current_index = 0
         
-        # Rotation control
-        self._rotation_thread: Optional[threading.Thread] = None
-        self._rotation_running = False
-        self._rotation_event = threading.Event()
-        self._stop_event = threading.Event()
+        # Rotation control: a UI-thread timer, so ticks need no marshalling
+        self._rotation_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self._on_rotation_tick, self._rotation_timer)
+        self._rotation_active = False
+        # Low-frequency check that resumes rotation when the market reopens
+        self._market_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self._on_market_check, self._market_timer)
+        
+        # Change-triggered jumps: time of the last one, and a throttled one still to show
+        self._last_change_switch = 0.0
+        self._pending_change_code: Optional[str] = None
+        # Shows a throttled jump when no rotation tick will ('change' mode, paused)
+        self._change_flush_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self._on_change_flush, self._change_flush_timer)
+        
+        # Tooltip last passed to SetIcon; each SetIcon is a Shell_NotifyIcon call
+        self._last_tooltip = ""
         
         # Callbacks
         self._on_exit_callback: Optional[Callable] = None
         self._on_menu_open_callback: Optional[Callable] = None
         self._on_menu_close_callback: Optional[Callable] = None
+        # Persistent one-shot timer for the deferred menu-close callback
+        self._menu_close_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self._fire_menu_close, self._menu_close_timer)
         
         # Set icon
         self._set_icon(icon_path)
         
-        # Bind events
+        # Bind events once; the popup menu is rebuilt per click but its
+        # commands are forwarded to the icon, so handlers stay registered here
+        self._manage_id = wx.NewIdRef()
+        self.Bind(wx.EVT_MENU, self._on_manage, id=self._manage_id)
+        self.Bind(wx.EVT_MENU, self._on_exit, id=wx.ID_EXIT)
+        self._bound_on_menu_close = self._on_menu_close
         
         self._logger.info("Tray icon initialized")
     
@@ -99,6 +121,7 @@ class ETFTrayIcon(wx.adv.TaskBarIcon):
             # Save icon as instance attribute
             self.icon = icon
             self.SetIcon(icon, "ETF Monitor")
+            self._last_tooltip = "ETF Monitor"
             
         except Exception as e:
             self._logger.error(f"Failed to set icon: {e}")
@@ -120,13 +143,10 @@ class ETFTrayIcon(wx.adv.TaskBarIcon):
         menu = wx.Menu()
         
         # 绑定菜单销毁事件以恢复守护
-        menu.Bind(wx.EVT_MENU_CLOSE, self._on_menu_close)
+        menu.Bind(wx.EVT_MENU_CLOSE, self._bound_on_menu_close)
 
-        manage_item = menu.Append(wx.ID_ANY, "管理")
-        menu.Bind(wx.EVT_MENU, self._on_manage, manage_item)
-
-        item = menu.Append(wx.ID_EXIT, "退出")
-        menu.Bind(wx.EVT_MENU, self._on_exit, item)
+        menu.Append(self._manage_id, "管理")
+        menu.Append(wx.ID_EXIT, "退出")
         
         return menu
     
@@ -134,74 +154,133 @@ class ETFTrayIcon(wx.adv.TaskBarIcon):
         """
         Update ETF data and optionally trigger rotation.
         
+        The dict is kept by reference, not copied: callers must pass a
+        fresh snapshot per update and not mutate it afterwards (the fetcher
+        builds a new dict every round).
+        
         Args:
             etf_data: Dictionary mapping code to ETFQuote
             changed_codes: List of codes that changed (for change-triggered rotation)
         """
-        self._etf_data = etf_data.copy()
-        self._etf_codes = list(etf_data.keys())
+        # Called from the fetcher thread; apply on the UI thread where the timer ticks
+        wx.CallAfter(self._apply_data, etf_data, changed_codes)
+    
+    def _apply_data(self, etf_data: Dict[str, ETFQuote], changed_codes: Optional[list]) -> None:
+        """Store new data and jump to the first changed ETF (runs on the UI thread)."""
+        # Format each quote once per update instead of on every rotation tick;
+        # quotes are immutable, so an identical object keeps its cached text
+        old_data = self._etf_data
+        old_tooltips = self._formatted_tooltips
+        self._formatted_tooltips = {
+            code: old_tooltips[code] if old_data.get(code) is quote and code in old_tooltips
+            else self._format_tooltip(quote)
+            for code, quote in etf_data.items() if quote
+        }
+        # Keep the rotation order while the code set is stable; the fetcher
+        # fills the dict in completion order, which varies between rounds
+        if etf_data.keys() != old_data.keys():
+            self._etf_codes = list(etf_data.keys())
+            self._code_to_index = {code: i for i, code in enumerate(self._etf_codes)}
+        self._etf_data = etf_data
         
         # Trigger rotation if in change mode and data changed
         if changed_codes and self._rotation_mode in ['change', 'both']:
-            if changed_codes:
-                # Switch to first changed ETF
-                if changed_codes[0] in self._etf_codes:
-                    self._current_index = self._etf_codes.index(changed_codes[0])
-                    self._update_tooltip()
-                    self._rotation_event.set()
+            # Switch to first changed ETF
+            index = self._code_to_index.get(changed_codes[0])
+            if index is not None:
+                # Leading-edge throttle: at most one jump per 0.5s. Fetch rounds
+                # are 3s+ apart, but updates queued while the UI thread was
+                # blocked (menu, modal dialog) are delivered back to back and
+                # would otherwise flicker through several codes at once
+                now = time.monotonic()
+                elapsed = now - self._last_change_switch
+                if elapsed < 0.5:
+                    self._pending_change_code = changed_codes[0]
+                    if not self._rotation_timer.IsRunning() and not self._change_flush_timer.IsRunning():
+                        self._change_flush_timer.StartOnce(max(1, int((0.5 - elapsed) * 1000)))
+                    return
+                self._last_change_switch = now
+                self._pending_change_code = None
+                self._current_index = index
+                self._update_tooltip()
+    
+    def _on_change_flush(self, event) -> None:
+        """Show the change jump that was throttled, once the window has passed."""
+        pending = self._pending_change_code
+        index = self._code_to_index.get(pending) if pending is not None else None
+        if index is None:
+            return
+        self._last_change_switch = time.monotonic()
+        self._pending_change_code = None
+        self._current_index = index
+        self._update_tooltip()
     
     def start_rotation(self) -> None:
-        """Start tooltip rotation thread."""
-        if self._rotation_running:
+        """Start tooltip rotation timer."""
+        if self._rotation_active:
             return
         
-        self._rotation_running = True
-        self._stop_event.clear()
-        self._rotation_thread = threading.Thread(target=self._rotation_loop, daemon=True)
-        self._rotation_thread.start()
+        self._rotation_active = True
+        self._update_tooltip()
+        # 'change' mode only rotates from update_data, so no timer is needed
+        if self._rotation_mode in ['timer', 'both']:
+            self._rotation_timer.Start(self._rotation_interval * 1000)
         
         self._logger.info(f"Tooltip rotation started: {self._rotation_mode} mode, {self._rotation_interval}s interval")
     
     def stop_rotation(self) -> None:
-        """Stop tooltip rotation thread."""
-        if not self._rotation_running:
+        """Stop tooltip rotation timer."""
+        if not self._rotation_active:
             return
         
-        self._rotation_running = False
-        self._stop_event.set()
-        
-        if self._rotation_thread and self._rotation_thread.is_alive():
-            self._rotation_thread.join(timeout=2)
+        self._rotation_active = False
+        self._rotation_timer.Stop()
+        self._market_timer.Stop()
+        self._change_flush_timer.Stop()
         
         self._logger.info("Tooltip rotation stopped")
     
-    def _rotation_loop(self) -> None:
-        """Rotation loop running in background thread."""
-        while self._rotation_running:
-            try:
-                # Update tooltip with current ETF
-                wx.CallAfter(self._update_tooltip)
-                
-                # Wait for interval or event
-                if self._rotation_mode in ['timer', 'both']:
-                    # Timer-based rotation
-                    if self._stop_event.wait(timeout=self._rotation_interval):
-                        break
-                    
-                    # Move to next ETF
-                    self._advance_index()
-                    
-                elif self._rotation_mode == 'change':
-                    # Wait for change event
-                    self._rotation_event.wait()
-                    self._rotation_event.clear()
-                    
-                    if not self._rotation_running:
-                        break
-                        
-            except Exception as e:
-                self._logger.error(f"Error in rotation loop: {e}")
-                time.sleep(1)
+    def cleanup(self) -> None:
+        """Stop every owned timer; call before Destroy() so none fires on a dead icon."""
+        self.stop_rotation()
+        for timer in (self._rotation_timer, self._market_timer,
+                      self._change_flush_timer, self._menu_close_timer):
+            timer.Stop()
+    
+    def _on_rotation_tick(self, event) -> None:
+        """Move to the next ETF on each timer tick (UI thread)."""
+        try:
+            if not is_trading_time():
+                # Quotes are frozen until the next session; stop ticking and
+                # poll once a minute for the market to reopen instead
+                self._rotation_timer.Stop()
+                self._market_timer.Start(60 * 1000)
+                self._update_tooltip()
+                self._logger.debug("Market closed, tooltip rotation paused")
+                return
+            pending = self._pending_change_code
+            index = self._code_to_index.get(pending) if pending is not None else None
+            if index is not None:
+                # Show the change that was throttled instead of moving on
+                self._pending_change_code = None
+                self._current_index = index
+            else:
+                self._advance_index()
+            self._update_tooltip()
+        except Exception as e:
+            self._logger.error(f"Error in rotation tick: {e}")
+    
+    def _on_market_check(self, event) -> None:
+        """Resume timer rotation once trading time starts again."""
+        # Keep the trading-status suffix current while paused; unchanged
+        # text is skipped by _set_tooltip
+        self._update_tooltip()
+        if not is_trading_time():
+            return
+        self._market_timer.Stop()
+        if self._rotation_active and self._rotation_mode in ['timer', 'both']:
+            self._rotation_timer.Start(self._rotation_interval * 1000)
+            self._logger.debug("Market open, tooltip rotation resumed")
     
     def _advance_index(self) -> None:
         """Advance to next ETF in rotation."""
@@ -213,7 +292,7 @@ class ETFTrayIcon(wx.adv.TaskBarIcon):
     def _update_tooltip(self) -> None:
         """Update tooltip and icon with current ETF data."""
         if not self._etf_codes or not self._etf_data:
-            self.SetIcon(self.icon, "ETF Monitor - 暂无数据")
+            self._set_tooltip("ETF Monitor - 暂无数据")
             return
         
         # Get current ETF
@@ -221,34 +300,43 @@ class ETFTrayIcon(wx.adv.TaskBarIcon):
             self._current_index = 0
         
         code = self._etf_codes[self._current_index]
-        quote = self._etf_data.get(code)
+        tooltip = self._formatted_tooltips.get(code)
         
-        if not quote:
-            self.SetIcon(self.icon, "ETF Monitor - 加载中...")
+        if not tooltip:
+            self._set_tooltip("ETF Monitor - 加载中...")
             return
         
+        # 添加交易状态提示（随时间变化，不缓存）
+        trading, trading_status = get_trading_status()
+        if not trading:
+            tooltip += f"\n[{trading_status}]"
+        
+        # 更新图标，仅更新 tooltip
+        self._set_tooltip(tooltip)
+    
+    def _format_tooltip(self, quote: ETFQuote) -> str:
+        """Build the quote part of the tooltip (pure function of the quote)."""
         # 创建显示文字：股票名 净值 涨跌幅
         try:
             change_text = format_percent_with_arrow(quote.change_percent)
             # 创建 tooltip 文字（鼠标悬停时显示更详细信息）
-            tooltip = f"{quote.name} ({quote.code})\n"
-            tooltip += f"最新价: {quote.price:.3f}\n"
-            tooltip += f"涨跌幅: {change_text}\n"
-            tooltip += f"更新: {quote.update_time}"
-            
-            # 添加交易状态提示
-            if not is_trading_time():
-                trading_status = get_next_trading_time()
-                tooltip += f"\n[{trading_status}]"
-            
-            # 更新图标，仅更新 tooltip
-            self.SetIcon(self.icon, tooltip)
-                
+            return (
+                f"{quote.name} ({quote.code})\n"
+                f"最新价: {quote.price:.3f}\n"
+                f"涨跌幅: {change_text}\n"
+                f"更新: {quote.update_time}"
+            )
         except Exception as e:
-            self._logger.error(f"Error updating icon: {e}", exc_info=True)
-            # 出错时使用默认图标
-            tooltip = f"{quote.name} ({quote.code})\n{quote.price:.3f}"
-            self.SetIcon(self.icon, tooltip)
+            self._logger.error(f"Error formatting tooltip: {e}", exc_info=True)
+            # 出错时使用简化文字
+            return f"{quote.name} ({quote.code})\n{quote.price:.3f}"
+    
+    def _set_tooltip(self, tooltip: str) -> None:
+        """Push the tooltip to the tray only when its text changed."""
+        if tooltip == self._last_tooltip:
+            return
+        self._last_tooltip = tooltip
+        self.SetIcon(self.icon, tooltip)
     
     def update_rotation_settings(self, interval: int, mode: str) -> None:
         """
@@ -260,6 +348,13 @@ class ETFTrayIcon(wx.adv.TaskBarIcon):
         """
         self._rotation_interval = interval
         self._rotation_mode = mode
+        
+        # Apply the new interval/mode if rotation is on
+        if self._rotation_active:
+            self._rotation_timer.Stop()
+            self._market_timer.Stop()
+            if mode in ['timer', 'both']:
+                self._rotation_timer.Start(interval * 1000)
         self._logger.info(f"Rotation settings updated: {mode} mode, {interval}s interval")
     
     # Event handlers
@@ -299,8 +394,13 @@ class ETFTrayIcon(wx.adv.TaskBarIcon):
         """Handle menu close event."""
         if self._on_menu_close_callback:
             try:
-                wx.CallLater(200, self._on_menu_close_callback)
+                self._menu_close_timer.StartOnce(200)
             except Exception as e:
                 self._logger.error(f"Error in menu close callback: {e}")
         event.Skip()
+    
+    def _fire_menu_close(self, event) -> None:
+        """Run the menu close callback (deferred from _on_menu_close)."""
+        if self._on_menu_close_callback:
+            self._on_menu_close_callback()
 
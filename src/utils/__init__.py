@@ -3,7 +3,10 @@ Utility modules for logging and helper functions.
 """
 
 from .logger import setup_logger, get_logger
-from .helpers import format_price, format_percent, validate_etf_code, format_volume
+from .helpers import (
+    format_price, format_percent, validate_etf_code, format_volume,
+    clear_format_caches,
+)
 
 __all__ = [
     'setup_logger',
@@ -12,5 +15,6 @@ __all__ = [
     'format_percent',
     'validate_etf_code',
     'format_volume',
+    'clear_format_caches',
 ]
 
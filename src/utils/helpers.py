@@ -2,13 +2,52 @@
 Helper functions for data formatting, validation, and common operations.
 """
 
-import re
+import math
+from datetime import datetime
+from functools import lru_cache, wraps
 from typing import Optional, Tuple, Callable, List
 import wx
 import time
 import threading
 
 
+# Two-digit code prefix -> market prefix used in API requests
+# Shanghai market: 50xxxx, 51xxxx, 52xxxx, 56xxxx, 58xxxx
+# Shenzhen market: 15xxxx, 16xxxx, 18xxxx
+_MARKET_PREFIX_MAP = {
+    '50': "1", '51': "1", '52': "1", '56': "1", '58': "1",
+    '15': "0", '16': "0", '18': "0",
+}
+
+
+def _memoize_number(fn: Callable) -> Callable:
+    """
+    Memoize a single-number formatter.
+    
+    The sign goes into the cache key: 0.0 and -0.0 compare and hash equal,
+    so one slot would otherwise serve whichever was formatted first. NaN is
+    formatted uncached since it never matches its own cache entry.
+    """
+    @lru_cache(maxsize=4096, typed=True)
+    def cached(value, sign):
+        return fn(value)
+    
+    @wraps(fn)
+    def wrapper(value):
+        if value is None:
+            return cached(None, 1.0)
+        if value != value:  # NaN
+            return fn(value)
+        return cached(value, math.copysign(1.0, value))
+    
+    wrapper.cache_clear = cached.cache_clear
+    wrapper.cache_info = cached.cache_info
+    return wrapper
+
+
+# The single-value format_* helpers are pure and see the same values tick
+# after tick, so they are memoized; clear_format_caches() resets them
+@_memoize_number
 def format_price(price: Optional[float]) -> str:
     """
     Format price to display string with appropriate precision.
@@ -39,12 +78,13 @@ def format_percent(percent: Optional[float], include_sign: bool = True) -> str:
     if percent is None:
         return "--"
     
+    text = format(percent, ".2f") + "%"
     if include_sign and percent > 0:
-        return f"+{percent:.2f}%"
-    else:
-        return f"{percent:.2f}%"
+        return "+" + text
+    return text
 
 
+@_memoize_number
 def format_percent_with_arrow(percent: Optional[float]) -> str:
     """
     Format percentage with directional arrow (↑/↓/-).
@@ -59,13 +99,20 @@ def format_percent_with_arrow(percent: Optional[float]) -> str:
         return "--"
     
     if percent > 0:
-        return f"↑{percent:.2f}%"
-    elif percent < 0:
-        return f"↓{abs(percent):.2f}%"
-    else:
-        return "0.00%"
+        return "↑" + format(percent, ".2f") + "%"
+    if percent < 0:
+        return "↓" + format(-percent, ".2f") + "%"
+    return "0.00%"
 
 
+# Volume units; divided (not multiplied by 1e-8/1e-4) so values on a
+# rounding half, e.g. 12.5万, round exactly as before
+_YI = 100_000_000
+_WAN = 10_000
+
+
+# Cache is typed: 5000 and 5000.0 hash alike but str() renders them differently
+@_memoize_number
 def format_volume(volume: Optional[int]) -> str:
     """
     Format trading volume to human-readable string.
@@ -76,20 +123,26 @@ def format_volume(volume: Optional[int]) -> str:
     Returns:
         Formatted volume string (e.g., "1.2亿", "8500万")
     """
-    if volume is None or volume == 0:
+    if not volume:
         return "--"
     
     # Convert to 亿 (hundred million)
-    if volume >= 100_000_000:
-        return f"{volume / 100_000_000:.1f}亿"
+    if volume >= _YI:
+        return format(volume / _YI, ".1f") + "亿"
     
     # Convert to 万 (ten thousand)
-    if volume >= 10_000:
-        return f"{volume / 10_000:.0f}万"
+    if volume >= _WAN:
+        return format(volume / _WAN, ".0f") + "万"
     
     return str(volume)
 
 
+def clear_format_caches() -> None:
+    """Drop memoized results of the format_* helpers."""
+    for fn in (format_price, format_percent_with_arrow, format_volume):
+        fn.cache_clear()
+
+
 def validate_etf_code(code: str) -> bool:
     """
     Validate ETF code format (6-digit number).
@@ -100,12 +153,8 @@ def validate_etf_code(code: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    if not code:
-        return False
-    
-    # Must be exactly 6 digits
-    pattern = r'^\d{6}$'
-    return bool(re.match(pattern, code))
+    # Must be exactly 6 ASCII digits; plain str checks, no regex engine
+    return bool(code) and len(code) == 6 and code.isascii() and code.isdigit()
 
 
 def get_market_prefix(code: str) -> str:
@@ -121,26 +170,15 @@ def get_market_prefix(code: str) -> str:
     if not code or len(code) != 6:
         return "1"  # Default to Shanghai
     
-    # Shanghai market: 50xxxx, 51xxxx, 52xxxx, 56xxxx, 58xxxx
-    # Shenzhen market: 15xxxx, 16xxxx, 18xxxx
-    first_two = code[:2]
-    
-    if first_two in ['50', '51', '52', '56', '58']:
-        return "1"  # Shanghai
-    elif first_two in ['15', '16', '18']:
-        return "0"  # Shenzhen
-    else:
-        # Default to Shanghai for unknown patterns
-        return "1"
+    # Default to Shanghai for unknown patterns
+    return _MARKET_PREFIX_MAP.get(code[:2], "1")
 
 def parse_symbol(symbol: str) -> Tuple[str, str]:
-    market = ""
-    core = symbol
-    if "." in symbol:
-        parts = symbol.split(".")
-        core = parts[0]
-        market = parts[1].upper()
-    return market, core
+    core, sep, rest = symbol.partition(".")
+    if not sep:
+        return "", symbol
+    # Market is the segment after the first dot, as split(".")[1] was
+    return rest.partition(".")[0].upper(), core
 
 
 def get_color_for_change(change_percent: Optional[float]) -> str:
@@ -153,15 +191,11 @@ def get_color_for_change(change_percent: Optional[float]) -> str:
     Returns:
         Color name ("green", "red", "gray")
     """
-    if change_percent is None:
+    # None, NaN and 0 are all flat
+    if change_percent is None or change_percent != change_percent or change_percent == 0:
         return "gray"
     
-    if change_percent > 0:
-        return "green"
-    elif change_percent < 0:
-        return "red"
-    else:
-        return "gray"
+    return "green" if change_percent > 0 else "red"
 
 
 def clamp(value: float, min_value: float, max_value: float) -> float:
@@ -179,6 +213,27 @@ def clamp(value: float, min_value: float, max_value: float) -> float:
     return max(min_value, min(value, max_value))
 
 
+def _seconds_of_day(h: int, m: int) -> int:
+    return h * 3600 + m * 60
+
+
+# Session boundaries as seconds since midnight (inclusive ranges)
+_MORNING_START = _seconds_of_day(9, 0)
+_MORNING_END = _seconds_of_day(11, 30)
+_AFTERNOON_START = _seconds_of_day(13, 0)
+_AFTERNOON_END = _seconds_of_day(15, 0)
+_MORNING_AUCTION_END = _seconds_of_day(9, 30)
+_CLOSING_AUCTION_START = _seconds_of_day(14, 57)
+
+
+def _weekday_seconds() -> Optional[int]:
+    """Seconds since midnight now, or None on weekends."""
+    now = datetime.now()
+    if now.weekday() >= 5:  # 5=Saturday, 6=Sunday
+        return None
+    return now.hour * 3600 + now.minute * 60 + now.second
+
+
 def is_trading_time() -> bool:
     """
     检测当前是否在交易时间内
@@ -191,27 +246,12 @@ def is_trading_time() -> bool:
     Returns:
         True if in trading hours
     """
-    from datetime import datetime, time
-    
-    now = datetime.now()
-    
-    # 检查是否周末
-    if now.weekday() >= 5:  # 5=Saturday, 6=Sunday
+    t = _weekday_seconds()
+    if t is None:
         return False
     
-    # 检查时间
-    current_time = now.time()
-    
-    # 上午交易时间 09:00-11:30（包含盘前和集合竞价）
-    morning_start = time(9, 0)
-    morning_end = time(11, 30)
-    
-    # 下午交易时间 13:00-15:00
-    afternoon_start = time(13, 0)
-    afternoon_end = time(15, 0)
-    
-    return (morning_start <= current_time <= morning_end or 
-            afternoon_start <= current_time <= afternoon_end)
+    return (_MORNING_START <= t <= _MORNING_END or
+            _AFTERNOON_START <= t <= _AFTERNOON_END)
 
 
 def is_call_auction_time() -> bool:
@@ -227,26 +267,12 @@ def is_call_auction_time() -> bool:
     Returns:
         True if in call auction or pre-market period
     """
-    from datetime import datetime, time
-    
-    now = datetime.now()
-    
-    # 检查是否周末
-    if now.weekday() >= 5:
+    t = _weekday_seconds()
+    if t is None:
         return False
     
-    current_time = now.time()
-    
-    # 盘前准备及集合竞价：09:00-09:30（扩大范围，避免数据不稳定期触发告警）
-    morning_prepare_start = time(9, 0)
-    morning_auction_end = time(9, 30)
-    
-    # 收盘集合竞价：14:57-15:00
-    closing_auction_start = time(14, 57)
-    closing_auction_end = time(15, 0)
-    
-    return (morning_prepare_start <= current_time <= morning_auction_end or
-            closing_auction_start <= current_time <= closing_auction_end)
+    return (_MORNING_START <= t <= _MORNING_AUCTION_END or
+            _CLOSING_AUCTION_START <= t <= _AFTERNOON_END)
 
 
 def get_next_trading_time() -> str:
@@ -256,30 +282,46 @@ def get_next_trading_time() -> str:
     Returns:
         描述字符串
     """
-    from datetime import datetime, time
-    
-    now = datetime.now()
-    current_time = now.time()
+    t = _weekday_seconds()
     
     # 周末
-    if now.weekday() >= 5:
+    if t is None:
         return "周末休市"
     
     # 早于09:00
-    if current_time < time(9, 0):
+    if t < _MORNING_START:
         return "盘前准备，09:00 开始"
     
     # 11:30-13:00午休
-    if time(11, 30) < current_time < time(13, 0):
+    if _MORNING_END < t < _AFTERNOON_START:
         return "午休中，13:00 开盘"
     
     # 15:00后
-    if current_time > time(15, 0):
+    if t > _AFTERNOON_END:
         return "已收盘，明日 09:00 开始"
     
     return "交易中"
 
 
+@lru_cache(maxsize=2)
+def _trading_status_at(second: int) -> Tuple[bool, str]:
+    """Compute the trading status once per wall-clock second bucket."""
+    return is_trading_time(), get_next_trading_time()
+
+
+def get_trading_status() -> Tuple[bool, str]:
+    """
+    获取当前交易状态（按秒缓存）
+
+    Rotation ticks and display updates ask several times per second;
+    calls within the same second share one result.
+
+    Returns:
+        (是否交易时间, 下一交易时段描述)
+    """
+    return _trading_status_at(int(time.time()))
+
+
 def create_text_icon(
     text: str,
     width: int = 350,
@@ -367,13 +409,18 @@ class Debouncer:
         self._last = {}
 
     def allow(self, key: str, interval_ms: int) -> bool:
-        now = time.perf_counter()
-        last = self._last.get(key, 0.0)
-        if (now - last) * 1000 < interval_ms:
+        # Integer nanoseconds: no float scaling on this per-event gate
+        now = time.monotonic_ns()
+        last = self._last.get(key)
+        if last is not None and now - last < interval_ms * 1_000_000:
             return False
         self._last[key] = now
         return True
 
+    def clear(self, key: str) -> None:
+        """Forget the last call for key so the next allow() passes."""
+        self._last.pop(key, None)
+
 
 def set_button_loading(btn: wx.Button, loading: bool):
     if loading:
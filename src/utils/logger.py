@@ -2,15 +2,22 @@
 Logging configuration with rotating file handler and level-based filtering.
 
 Provides centralized logging setup for the application with:
-- Daily log rotation with 7-day retention
+- Size-based log rotation (10 MB per file, 7 backups); daily rotation with
+  7-day retention is available via rotate_daily. Size rotation is the default
+  because its rollover check is a size comparison, while the timed handler
+  tracks day boundaries on every record; in exchange, old files are dropped
+  by volume rather than by age
 - Configurable log levels (DEBUG, INFO, WARNING, ERROR, CRITICAL)
 - Console and file output
 - Thread-safe operation
+
+Log calls should pass arguments %-style (logger.debug("... %s", x)) rather
+than pre-formatting with f-strings, so dropped records are never formatted.
 """
 
 import logging
 import os
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import MemoryHandler, RotatingFileHandler, TimedRotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
@@ -20,12 +27,21 @@ DEFAULT_LOG_DIR = "logs"
 DEFAULT_LOG_FILE = "etf_monitor.log"
 DEFAULT_LOG_LEVEL = logging.INFO
 
+# File records are buffered and written in batches of this many, or at once
+# for WARNING and above
+LOG_BUFFER_CAPACITY = 512
+
+# Size-based rotation limits
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 7
+
 
 def setup_logger(
     name: str = "etf_monitor",
     log_dir: Optional[str] = None,
     log_level: int = DEFAULT_LOG_LEVEL,
-    console_output: bool = True
+    console_output: bool = True,
+    rotate_daily: bool = False
 ) -> logging.Logger:
     """
     Set up the application logger with file rotation and optional console output.
@@ -35,6 +51,7 @@ def setup_logger(
         log_dir: Directory for log files (created if doesn't exist)
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         console_output: Whether to output logs to console
+        rotate_daily: Rotate at midnight instead of by file size
         
     Returns:
         Configured logger instance
@@ -46,6 +63,8 @@ def setup_logger(
         return logger
     
     logger.setLevel(log_level)
+    # Records are handled here; don't format them again via the root logger
+    logger.propagate = False
     
     # Create log directory if needed
     if log_dir is None:
@@ -60,18 +79,36 @@ def setup_logger(
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     
-    # File handler with daily rotation (keep 7 days)
     log_file_path = log_path / DEFAULT_LOG_FILE
-    file_handler = TimedRotatingFileHandler(
-        filename=str(log_file_path),
-        when='midnight',
-        interval=1,
-        backupCount=7,
-        encoding='utf-8'
-    )
+    if rotate_daily:
+        # File handler with daily rotation (keep 7 days)
+        file_handler = TimedRotatingFileHandler(
+            filename=str(log_file_path),
+            when='midnight',
+            interval=1,
+            backupCount=LOG_BACKUP_COUNT,
+            encoding='utf-8'
+        )
+    else:
+        # File handler with size-based rotation (keep 7 backups)
+        file_handler = RotatingFileHandler(
+            filename=str(log_file_path),
+            maxBytes=LOG_MAX_BYTES,
+            backupCount=LOG_BACKUP_COUNT,
+            encoding='utf-8'
+        )
     file_handler.setLevel(log_level)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    # Buffer in front of the file so routine records don't hit the disk one
+    # by one on the fetch/UI threads; logging.shutdown() flushes it on exit
+    buffered_handler = MemoryHandler(
+        capacity=LOG_BUFFER_CAPACITY,
+        flushLevel=logging.WARNING,
+        target=file_handler,
+        flushOnClose=True
+    )
+    buffered_handler.setLevel(log_level)
+    logger.addHandler(buffered_handler)
     
     # Console handler (optional)
     if console_output:
@@ -0,0 +1,51 @@
+import math
+
+import pytest
+
+pytest.importorskip("wx")
+
+from src.utils import helpers  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _fresh_format_caches():
+    helpers.clear_format_caches()
+    yield
+    helpers.clear_format_caches()
+
+
+def test_format_percent_signed_zero_order_independent():
+    assert helpers.format_percent(-0.0) == "-0.00%"
+    assert helpers.format_percent(0.0) == "0.00%"
+
+
+def test_format_percent_with_arrow_signed_zero():
+    assert helpers.format_percent_with_arrow(-0.0) == "0.00%"
+    assert helpers.format_percent_with_arrow(0.0) == "0.00%"
+
+
+@pytest.mark.parametrize("first, second", [(-0.0, 0.0), (0.0, -0.0)])
+def test_format_price_signed_zero_order_independent(first, second):
+    for value in (first, second):
+        expected = "-0.000" if math.copysign(1.0, value) < 0 else "0.000"
+        assert helpers.format_price(value) == expected
+
+
+@pytest.mark.parametrize("fn", [helpers.format_price, helpers.format_percent_with_arrow])
+def test_nan_is_not_cached(fn):
+    fn(math.nan)
+    fn(float("nan"))
+    assert fn.cache_info().currsize == 0
+
+
+def test_format_volume_keeps_int_and_float_apart():
+    assert helpers.format_volume(5000) == "5000"
+    assert helpers.format_volume(5000.0) == "5000.0"
+
+
+@pytest.mark.parametrize("value, expected", [
+    (None, "gray"), (0, "gray"), (-0.0, "gray"), (math.nan, "gray"),
+    (0.01, "green"), (-0.01, "red"),
+])
+def test_get_color_for_change(value, expected):
+    assert helpers.get_color_for_change(value) == expected
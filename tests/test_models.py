@@ -0,0 +1,28 @@
+import copy
+import pickle
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from src.data.models import ETFQuote  # noqa: E402
+
+
+def _quote():
+    return ETFQuote(
+        code="512170", name="医疗ETF", price=0.456, change=0.012,
+        change_percent=2.7, volume=123456789, pre_close=0.444,
+        update_time="10:30:00", timestamp=1700000000.0,
+    )
+
+
+@pytest.mark.parametrize("clone", [
+    copy.copy,
+    copy.deepcopy,
+    lambda q: pickle.loads(pickle.dumps(q)),
+])
+def test_quote_round_trip(clone):
+    quote = _quote()
+    restored = clone(quote)
+    assert restored == quote
+    assert restored is not quote